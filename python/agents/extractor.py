@@ -7,36 +7,113 @@ Outputs structured ExtractedFrame[] matching the schema.
 Usage:
     from agents.extractor import extract_frames
     frames = await extract_frames(document_text, languages=["en", "de"])
+
+    from agents.extractor import extract_frames_many
+    results = await extract_frames_many([doc_a, doc_b], languages=["en", "de"])
 """
 
+import asyncio
 import json
 import os
 from typing import List, Optional
 
+import httpx
+import orjson
 from mistralai import Mistral
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lib.cache import CACHE_ROOT, atomic_write, cache_key, read_or_discard
 from lib.schemas import ExtractedFrame
 
 
-# Mistral client (lazy init)
+# Mistral client (lazy init). Its connection pool is bound to the event
+# loop it was created on, so a new asyncio.run() gets a fresh client.
 _client = None
+_client_loop = None
+
+# Max in-flight Mistral requests for extract_frames_many
+EXTRACTOR_CONCURRENCY = int(os.environ.get("LACUNA_EXTRACTOR_CONCURRENCY", "8"))
+
+# Document budget sent to the model (~15k chars of English prose).
+# Counted with the mistral-common tokenizer (see requirements.txt); if that
+# package is missing we fall back to MAX_DOCUMENT_CHARS.
+MAX_DOCUMENT_TOKENS = 4000
+MAX_DOCUMENT_CHARS = 15000
+
+# Mistral tokenizer (lazy init). False = mistral-common not installed.
+_tokenizer = None
+
+# On-disk cache of raw extractor responses, keyed by request content.
+# Set LACUNA_EXTRACTOR_CACHE=0 to always call Mistral.
+EXTRACTOR_CACHE_DIR = CACHE_ROOT / "extractor"
+EXTRACTOR_CACHE_ENABLED = os.environ.get("LACUNA_EXTRACTOR_CACHE", "1") != "0"
 
 
 def get_client() -> Mistral:
-    """Get or create Mistral client."""
-    global _client
-    if _client is None:
+    """Get or create Mistral client for the running event loop."""
+    global _client, _client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _client is None or loop is not _client_loop:
         api_key = os.environ.get("MISTRAL_API_KEY")
         if not api_key:
             raise ValueError("MISTRAL_API_KEY environment variable not set")
-        _client = Mistral(api_key=api_key)
+        # Keep-alive HTTP/2 pool (up to 32 connections) shared by all
+        # concurrent extractions on this loop
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+        _client = Mistral(api_key=api_key, async_client=http_client)
+        _client_loop = loop
     return _client
 
 
+def get_tokenizer():
+    """Get or create the Mistral tokenizer. Returns None if mistral-common is missing."""
+    global _tokenizer
+    if _tokenizer is None:
+        try:
+            from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
+        except ImportError:
+            print("[extractor] mistral-common not installed, truncating by characters")
+            _tokenizer = False
+        else:
+            _tokenizer = MistralTokenizer.v3().instruct_tokenizer.tokenizer
+    return _tokenizer or None
+
+
+def truncate_document(document: str, max_tokens: int = MAX_DOCUMENT_TOKENS) -> str:
+    """
+    Truncate a document to a token budget.
+
+    Token-based so dense scripts (CJK, German compounds) get the same
+    budget as English. Without mistral-common, falls back to a character
+    limit cut at the last whitespace so words are not split.
+    """
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        if len(document) <= MAX_DOCUMENT_CHARS:
+            return document
+        cut = document.rfind(" ", 0, MAX_DOCUMENT_CHARS)
+        return document[:cut if cut > 0 else MAX_DOCUMENT_CHARS]
+
+    tokens = tokenizer.encode(document, bos=False, eos=False)
+    if len(tokens) <= max_tokens:
+        return document
+    return tokenizer.decode(tokens[:max_tokens])
+
+
 EXTRACTION_SYSTEM_PROMPT = """You are a conceptual frame decomposer for the LACUNA project.
 
 Your task is to DECOMPOSE concepts into their constituent conceptual frames. Not keywords. FRAMES.
@@ -134,11 +211,35 @@ Return a JSON array of frames. Each frame must have:
 Return only the JSON array, no other text."""
 
 
+def _is_str_dict(value) -> bool:
+    """True if value is a dict of str -> str (safe to skip validation)."""
+    return isinstance(value, dict) and all(
+        isinstance(k, str) and isinstance(v, str) for k, v in value.items()
+    )
+
+
+def _cache_path(model: str, prompt: str) -> Path:
+    """Cache file for a (model, system prompt, user prompt) request."""
+    return EXTRACTOR_CACHE_DIR / f"{cache_key(model, EXTRACTION_SYSTEM_PROMPT, prompt)}.json"
+
+
+def _parse_frames_data(content: str) -> List:
+    """Pull the list of raw frame dicts out of an LLM response."""
+    data = orjson.loads(content)
+    # Handle both array and object with "frames" key
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict) and "frames" in data:
+        return data["frames"]
+    return [data] if isinstance(data, dict) else []
+
+
 async def extract_frames(
     document: str,
     languages: List[str] = ["en", "de"],
     max_concepts: int = 20,
     model: str = "mistral-large-latest",
+    use_cache: Optional[bool] = None,
 ) -> List[ExtractedFrame]:
     """
     Extract conceptual frames from a document using Mistral.
@@ -148,49 +249,62 @@ async def extract_frames(
         languages: Target languages for extraction
         max_concepts: Maximum number of concepts to extract
         model: Mistral model to use
+        use_cache: Replay/store responses in the on-disk cache
+            (default: EXTRACTOR_CACHE_ENABLED)
 
     Returns:
         List of ExtractedFrame objects
     """
-    client = get_client()
+    if use_cache is None:
+        use_cache = EXTRACTOR_CACHE_ENABLED
 
     prompt = EXTRACTION_USER_TEMPLATE.format(
         languages=", ".join(languages),
         max_concepts=max_concepts,
-        document=document[:15000],  # Truncate very long docs
-    )
-
-    response = await client.chat.complete_async(
-        model=model,
-        messages=[
-            {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-        temperature=0.3,  # Lower temperature for more consistent extraction
-        response_format={"type": "json_object"},
+        document=truncate_document(document),  # Truncate very long docs
     )
 
-    # Parse response
-    content = response.choices[0].message.content
-    try:
-        data = json.loads(content)
-        # Handle both array and object with "frames" key
-        if isinstance(data, list):
-            frames_data = data
-        elif isinstance(data, dict) and "frames" in data:
-            frames_data = data["frames"]
-        else:
-            frames_data = [data] if isinstance(data, dict) else []
-    except json.JSONDecodeError as e:
-        print(f"[extractor] Failed to parse JSON: {e}")
-        print(f"[extractor] Raw content: {content[:500]}")
-        return []
-
-    # Convert to Pydantic models
+    # Identical requests replay the cached response instead of calling Mistral
+    cache_path = _cache_path(model, prompt)
+    frames_data = None
+    if use_cache:
+        frames_data = read_or_discard(
+            cache_path, lambda data: _parse_frames_data(data.decode("utf-8"))
+        )
+        if frames_data is not None:
+            print(f"[extractor] Cache hit: {cache_path.name}")
+
+    if frames_data is None:
+        client = get_client()
+        response = await client.chat.complete_async(
+            model=model,
+            messages=[
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,  # Lower temperature for more consistent extraction
+            response_format={"type": "json_object"},
+        )
+        content = response.choices[0].message.content
+
+        # Parse response
+        try:
+            frames_data = _parse_frames_data(content)
+        except orjson.JSONDecodeError as e:
+            print(f"[extractor] Failed to parse JSON: {e}")
+            print(f"[extractor] Raw content: {content[:500]}")
+            return []
+
+        # Only cache responses that parsed
+        if use_cache:
+            atomic_write(cache_path, content.encode("utf-8"))
+
+    # Convert to Pydantic models. model_construct skips validation for
+    # well-formed frames; anything odd goes through the full validator.
     frames = []
     for fd in frames_data:
         try:
-            frame = ExtractedFrame(
+            fields = dict(
                 id=fd.get("id", "unknown"),
                 labels=fd.get("labels", {}),
                 definitions=fd.get("definitions", {}),
@@ -198,6 +312,17 @@ async def extract_frames(
                 source_quote=fd.get("source_quote"),
                 confidence=fd.get("confidence", 1.0),
             )
+            if (
+                isinstance(fields["id"], str)
+                and _is_str_dict(fields["labels"])
+                and _is_str_dict(fields["definitions"])
+                and isinstance(fields["cluster"], str)
+                and (fields["source_quote"] is None or isinstance(fields["source_quote"], str))
+            ):
+                fields["confidence"] = float(fields["confidence"])
+                frame = ExtractedFrame.model_construct(**fields)
+            else:
+                frame = ExtractedFrame(**fields)
             frames.append(frame)
         except Exception as e:
             print(f"[extractor] Failed to parse frame: {e}")
@@ -206,15 +331,41 @@ async def extract_frames(
     return frames
 
 
+async def extract_frames_many(
+    documents: List[str],
+    languages: List[str] = ["en", "de"],
+    max_concepts: int = 20,
+    model: str = "mistral-large-latest",
+    concurrency: int = EXTRACTOR_CONCURRENCY,
+    use_cache: Optional[bool] = None,
+) -> List[List[ExtractedFrame]]:
+    """
+    Extract frames from several documents concurrently.
+
+    Requests share the single Mistral client and are capped at
+    `concurrency` in flight so we stay under the API rate limit.
+
+    Returns:
+        One list of ExtractedFrame per document, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def extract_one(document: str) -> List[ExtractedFrame]:
+        async with semaphore:
+            return await extract_frames(document, languages, max_concepts, model, use_cache)
+
+    return list(await asyncio.gather(*(extract_one(d) for d in documents)))
+
+
 def extract_frames_sync(
     document: str,
     languages: List[str] = ["en", "de"],
     max_concepts: int = 20,
     model: str = "mistral-large-latest",
+    use_cache: Optional[bool] = None,
 ) -> List[ExtractedFrame]:
     """Synchronous wrapper for extract_frames."""
-    import asyncio
-    return asyncio.run(extract_frames(document, languages, max_concepts, model))
+    return asyncio.run(extract_frames(document, languages, max_concepts, model, use_cache))
 
 
 # CLI interface
@@ -222,21 +373,35 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Extract frames from document")
-    parser.add_argument("input", type=Path, help="Input document file")
+    parser.add_argument("input", type=Path, nargs="+", help="Input document file(s)")
     parser.add_argument("--output", "-o", type=Path, help="Output JSON file")
     parser.add_argument("--languages", "-l", nargs="+", default=["en", "de"])
     parser.add_argument("--max", "-m", type=int, default=20)
 
     args = parser.parse_args()
 
-    # Read document
-    with open(args.input) as f:
-        document = f.read()
-
-    print(f"[extractor] Processing {args.input} ({len(document)} chars)")
+    # Read documents
+    documents = []
+    for path in args.input:
+        with open(path) as f:
+            documents.append(f.read())
+        print(f"[extractor] Processing {path} ({len(documents[-1])} chars)")
 
     # Extract
-    frames = extract_frames_sync(document, args.languages, args.max)
+    if len(documents) == 1:
+        frames = extract_frames_sync(documents[0], args.languages, args.max)
+    else:
+        results = asyncio.run(extract_frames_many(documents, args.languages, args.max))
+        # Merge in input order; the first document to yield an id wins
+        frames = []
+        seen_ids = set()
+        for doc_frames in results:
+            for frame in doc_frames:
+                if frame.id in seen_ids:
+                    print(f"[extractor] Skipping duplicate frame id: {frame.id}")
+                    continue
+                seen_ids.add(frame.id)
+                frames.append(frame)
     print(f"[extractor] Extracted {len(frames)} frames")
 
     # Output
@@ -10,22 +10,53 @@ and structural reasons for the gap with citations.
 Usage:
     from agents.interpreter import interpret_lacuna
     explanation = interpret_lacuna(concept, neighbors, language)
+
+    from agents.interpreter import interpret_lacunae_batch
+    explanations = interpret_lacunae_batch(concepts, all_concepts)
+
+    from agents.interpreter import interpret_many
+    explanations = await interpret_many(concepts, all_concepts)
+
+    from agents.interpreter import interpret_lacuna_stream
+    for partial in interpret_lacuna_stream(**context):
+        render(partial)
 """
 
+import asyncio
 import json
 import os
-from typing import List, Dict, Optional
+import time
+from typing import Iterator, List, Dict, Optional, Tuple
 
+import httpx
+import numpy as np
+import orjson
 from mistralai import Mistral
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lib.cache import CACHE_ROOT, atomic_write, cache_key, read_or_discard
 
 # Mistral client (lazy init)
 _client = None
 
+# Async Mistral client (lazy init). Its connection pool is bound to the
+# event loop it was created on, so a new asyncio.run() gets a fresh client.
+_async_client = None
+_async_client_loop = None
+
+INTERPRETER_MODEL = "mistral-large-latest"
+
+# Max in-flight Mistral requests for interpret_many
+INTERPRETER_CONCURRENCY = int(os.environ.get("LACUNA_INTERPRETER_CONCURRENCY", "8"))
+
+# On-disk cache of raw interpreter responses, keyed by prompt content.
+# Set LACUNA_INTERPRETER_CACHE=0 to always call Mistral.
+INTERPRETER_CACHE_DIR = CACHE_ROOT / "interpreter"
+INTERPRETER_CACHE_ENABLED = os.environ.get("LACUNA_INTERPRETER_CACHE", "1") != "0"
+
 
 def get_client() -> Mistral:
     """Get or create Mistral client."""
@@ -38,6 +69,28 @@ def get_client() -> Mistral:
     return _client
 
 
+def get_async_client() -> Mistral:
+    """Get or create Mistral client for the running event loop."""
+    global _async_client, _async_client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _async_client is None or loop is not _async_client_loop:
+        api_key = os.environ.get("MISTRAL_API_KEY")
+        if not api_key:
+            raise ValueError("MISTRAL_API_KEY environment variable not set")
+        # Keep-alive pool shared by all concurrent interpretations on this loop
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        _async_client = Mistral(api_key=api_key, async_client=http_client)
+        _async_client_loop = loop
+    return _async_client
+
+
 INTERPRETER_SYSTEM_PROMPT = """You are a conceptual topology interpreter for the LACUNA project.
 
 LACUNA maps how the same historical concepts occupy different semantic positions across languages.
@@ -75,7 +128,61 @@ Respond in JSON format:
 """
 
 
-def interpret_lacuna(
+# Lacuna type codes, in the order they are checked
+LACUNA_ABSENT_PRIMARY = 0
+LACUNA_ABSENT_COMPARISON = 1
+LACUNA_SUBTLE_SHIFT = 2
+LACUNA_SIGNIFICANT_SHIFT = 3
+LACUNA_MAJOR_SHIFT = 4
+
+# Cross-language position distance thresholds (UMAP units)
+SIGNIFICANT_SHIFT_DISTANCE = 8.0
+MAJOR_SHIFT_DISTANCE = 15.0
+
+
+def classify_lacunae_batch(positions: np.ndarray, ghosts: np.ndarray) -> np.ndarray:
+    """
+    Lacuna type codes for many concepts at once.
+
+    Args:
+        positions: (N, 2, 2) array of [primary [x, z], comparison [x, z]]
+        ghosts: (N, 2) bool array of [primary ghost, comparison ghost]
+
+    Returns:
+        (N,) int8 array of LACUNA_* codes
+    """
+    positions = np.asarray(positions, dtype=float)
+    ghosts = np.asarray(ghosts, dtype=bool)
+    distance = np.linalg.norm(positions[:, 1] - positions[:, 0], axis=1)
+    # right=True keeps the strict "distance > threshold" of the scalar path
+    code = np.digitize(
+        distance, [SIGNIFICANT_SHIFT_DISTANCE, MAJOR_SHIFT_DISTANCE], right=True
+    ).astype(np.int8) + LACUNA_SUBTLE_SHIFT
+    code = np.where(ghosts[:, 1], LACUNA_ABSENT_COMPARISON, code)
+    code = np.where(ghosts[:, 0], LACUNA_ABSENT_PRIMARY, code)
+    return code.astype(np.int8)
+
+
+def describe_lacuna_type(
+    code: int,
+    distance: float,
+    primary_language: str = "en",
+    comparison_language: str = "de",
+) -> str:
+    """Prompt text for a LACUNA_* code."""
+    primary, comparison = primary_language.upper(), comparison_language.upper()
+    if code == LACUNA_ABSENT_PRIMARY:
+        return f"ABSENT in {primary} - exists only in {comparison} perspective"
+    if code == LACUNA_ABSENT_COMPARISON:
+        return f"ABSENT in {comparison} - exists only in {primary} perspective"
+    if code == LACUNA_MAJOR_SHIFT:
+        return f"MAJOR SHIFT - dramatically different position across languages (distance: {distance:.1f})"
+    if code == LACUNA_SIGNIFICANT_SHIFT:
+        return f"SIGNIFICANT SHIFT - different semantic neighborhood across languages (distance: {distance:.1f})"
+    return f"SUBTLE SHIFT - similar position but different local context (distance: {distance:.1f})"
+
+
+def build_interpretation_prompt(
     concept_id: str,
     concept_label: str,
     definitions: Dict[str, str],
@@ -85,26 +192,13 @@ def interpret_lacuna(
     cluster: str,
     primary_language: str = "en",
     comparison_language: str = "de",
-) -> Dict:
+) -> Tuple[str, str]:
     """
-    Generate interpretation for a concept's lacuna.
-
-    Args:
-        concept_id: The concept identifier
-        concept_label: The display label
-        definitions: {lang: definition} dictionary
-        neighbors: {lang: [{"id": ..., "label": ..., "similarity": ...}]} nearest neighbors
-        position: {lang: [x, z]} coordinates
-        is_ghost: {lang: bool} whether concept is a ghost in each language
-        cluster: The concept's cluster category
-        primary_language: Language being viewed
-        comparison_language: Language to compare against
+    Build the user prompt for a concept's lacuna.
 
     Returns:
-        Dict with cultural, historical, structural explanations and citations
+        Tuple of (user_prompt, lacuna_type)
     """
-    client = get_client()
-
     # Build context for interpretation
     primary_pos = position.get(primary_language, [0, 0])
     comparison_pos = position.get(comparison_language, [0, 0])
@@ -133,20 +227,21 @@ def interpret_lacuna(
     is_comparison_ghost = is_ghost.get(comparison_language, False)
 
     if is_primary_ghost:
-        lacuna_type = f"ABSENT in {primary_language.upper()} - exists only in {comparison_language.upper()} perspective"
+        code = LACUNA_ABSENT_PRIMARY
     elif is_comparison_ghost:
-        lacuna_type = f"ABSENT in {comparison_language.upper()} - exists only in {primary_language.upper()} perspective"
-    elif distance > 15:
-        lacuna_type = f"MAJOR SHIFT - dramatically different position across languages (distance: {distance:.1f})"
-    elif distance > 8:
-        lacuna_type = f"SIGNIFICANT SHIFT - different semantic neighborhood across languages (distance: {distance:.1f})"
+        code = LACUNA_ABSENT_COMPARISON
+    elif distance > MAJOR_SHIFT_DISTANCE:
+        code = LACUNA_MAJOR_SHIFT
+    elif distance > SIGNIFICANT_SHIFT_DISTANCE:
+        code = LACUNA_SIGNIFICANT_SHIFT
     else:
-        lacuna_type = f"SUBTLE SHIFT - similar position but different local context (distance: {distance:.1f})"
+        code = LACUNA_SUBTLE_SHIFT
+    lacuna_type = describe_lacuna_type(code, distance, primary_language, comparison_language)
 
     user_prompt = f"""Explain the conceptual lacuna for this concept:
 
-CONCEPT: {concept_label} ({concept_id})
 CLUSTER: {cluster}
+CONCEPT: {concept_label} ({concept_id})
 
 DEFINITIONS:
 - {primary_language.upper()}: {definitions.get(primary_language, 'N/A')}
@@ -165,21 +260,57 @@ NEAREST NEIGHBORS:
 Explain WHY this conceptual gap exists. Focus on Treaty of Versailles / WWI context.
 Be specific with historical details and citations."""
 
-    print(f"[interpreter] Generating interpretation for {concept_id}...")
+    return user_prompt, lacuna_type
 
-    response = client.chat.complete(
-        model="mistral-large-latest",
-        messages=[
-            {"role": "system", "content": INTERPRETER_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format={"type": "json_object"},
-    )
 
-    content = response.choices[0].message.content
+def build_messages(user_prompt: str) -> List[Dict]:
+    """
+    Chat messages for an interpretation request.
+
+    The system prompt is a constant and always comes first, so every
+    request shares the same prefix for provider-side prompt caching.
+    """
+    return [
+        {"role": "system", "content": INTERPRETER_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _cache_path(user_prompt: str) -> Path:
+    """Cache file for a (model, system prompt, user prompt) request."""
+    key = cache_key(INTERPRETER_MODEL, INTERPRETER_SYSTEM_PROMPT, user_prompt)
+    return INTERPRETER_CACHE_DIR / f"{key}.json"
+
+
+def _decode_json_text(data: bytes) -> str:
+    """Cached response text; raises ValueError unless it is valid JSON."""
+    content = data.decode("utf-8")
+    orjson.loads(content)
+    return content
+
+
+def _read_cache(user_prompt: str) -> Optional[str]:
+    """Stored response content for this prompt, or None on a miss."""
+    if not INTERPRETER_CACHE_ENABLED:
+        return None
+    return read_or_discard(_cache_path(user_prompt), _decode_json_text)
+
+
+def _write_cache(user_prompt: str, content: str):
+    """Store a response in the cache. Skips non-JSON."""
+    if not INTERPRETER_CACHE_ENABLED:
+        return
+    try:
+        orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return
+    atomic_write(_cache_path(user_prompt), content.encode("utf-8"))
 
+
+def parse_interpretation(content: str, lacuna_type: str) -> Dict:
+    """Parse the LLM's JSON response into an interpretation dict."""
     try:
-        result = json.loads(content)
+        result = orjson.loads(content)
         return {
             "cultural": result.get("cultural", ""),
             "historical": result.get("historical", ""),
@@ -188,7 +319,7 @@ Be specific with historical details and citations."""
             "summary": result.get("summary", ""),
             "lacuna_type": lacuna_type,
         }
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"[interpreter] Failed to parse LLM response as JSON")
         return {
             "cultural": content,
@@ -200,15 +331,251 @@ Be specific with historical details and citations."""
         }
 
 
-def interpret_concept_card(
+def interpret_lacuna(
+    concept_id: str,
+    concept_label: str,
+    definitions: Dict[str, str],
+    neighbors: Dict[str, List[Dict]],
+    position: Dict[str, List[float]],
+    is_ghost: Dict[str, bool],
+    cluster: str,
+    primary_language: str = "en",
+    comparison_language: str = "de",
+) -> Dict:
+    """
+    Generate interpretation for a concept's lacuna.
+
+    Args:
+        concept_id: The concept identifier
+        concept_label: The display label
+        definitions: {lang: definition} dictionary
+        neighbors: {lang: [{"id": ..., "label": ..., "similarity": ...}]} nearest neighbors
+        position: {lang: [x, z]} coordinates
+        is_ghost: {lang: bool} whether concept is a ghost in each language
+        cluster: The concept's cluster category
+        primary_language: Language being viewed
+        comparison_language: Language to compare against
+
+    Returns:
+        Dict with cultural, historical, structural explanations and citations
+    """
+    client = get_client()
+
+    user_prompt, lacuna_type = build_interpretation_prompt(
+        concept_id=concept_id,
+        concept_label=concept_label,
+        definitions=definitions,
+        neighbors=neighbors,
+        position=position,
+        is_ghost=is_ghost,
+        cluster=cluster,
+        primary_language=primary_language,
+        comparison_language=comparison_language,
+    )
+
+    cached = _read_cache(user_prompt)
+    if cached is not None:
+        print(f"[interpreter] Cache hit for {concept_id}")
+        return parse_interpretation(cached, lacuna_type)
+
+    print(f"[interpreter] Generating interpretation for {concept_id}...")
+
+    response = client.chat.complete(
+        model=INTERPRETER_MODEL,
+        messages=build_messages(user_prompt),
+        response_format={"type": "json_object"},
+    )
+
+    content = response.choices[0].message.content
+    _write_cache(user_prompt, content)
+    return parse_interpretation(content, lacuna_type)
+
+
+def _completed_fields(content: str) -> Dict:
+    """
+    Top-level fields of a partial JSON object that are already complete.
+
+    A value counts as complete once the following ',' or '}' has arrived,
+    so a number or string cut off mid-stream is never returned.
+    """
+    decoder = json.JSONDecoder()
+    fields = {}
+    pos = content.find("{")
+    if pos < 0:
+        return fields
+    pos += 1
+    n = len(content)
+    try:
+        while True:
+            while pos < n and content[pos] in " \t\r\n,":
+                pos += 1
+            key, pos = decoder.raw_decode(content, pos)
+            while pos < n and content[pos] in " \t\r\n:":
+                pos += 1
+            value, pos = decoder.raw_decode(content, pos)
+            end = pos
+            while end < n and content[end] in " \t\r\n":
+                end += 1
+            if end >= n or content[end] not in ",}":
+                break
+            fields[key] = value
+    except json.JSONDecodeError:
+        pass
+    return fields
+
+
+def _delta_text(content) -> str:
+    """Text of a streamed delta: a str, or a list of content chunks."""
+    if content is None or isinstance(content, str):
+        return content or ""
+    return "".join(getattr(chunk, "text", None) or "" for chunk in content)
+
+
+def interpret_lacuna_stream(
+    concept_id: str,
+    concept_label: str,
+    definitions: Dict[str, str],
+    neighbors: Dict[str, List[Dict]],
+    position: Dict[str, List[float]],
+    is_ghost: Dict[str, bool],
+    cluster: str,
+    primary_language: str = "en",
+    comparison_language: str = "de",
+) -> Iterator[Dict]:
+    """
+    Streaming version of interpret_lacuna for concept cards.
+
+    Takes the same arguments. Yields partial interpretation dicts as each
+    top-level field of the model's JSON completes, so the card can render
+    before the whole response arrives. The last dict yielded is the same
+    as interpret_lacuna's return value.
+    """
+    user_prompt, lacuna_type = build_interpretation_prompt(
+        concept_id=concept_id,
+        concept_label=concept_label,
+        definitions=definitions,
+        neighbors=neighbors,
+        position=position,
+        is_ghost=is_ghost,
+        cluster=cluster,
+        primary_language=primary_language,
+        comparison_language=comparison_language,
+    )
+
+    cached = _read_cache(user_prompt)
+    if cached is not None:
+        print(f"[interpreter] Cache hit for {concept_id}")
+        yield parse_interpretation(cached, lacuna_type)
+        return
+
+    print(f"[interpreter] Streaming interpretation for {concept_id}...")
+
+    client = get_client()
+    stream = client.chat.stream(
+        model=INTERPRETER_MODEL,
+        messages=build_messages(user_prompt),
+        response_format={"type": "json_object"},
+    )
+
+    content = ""
+    emitted = 0
+    for event in stream:
+        delta = _delta_text(event.data.choices[0].delta.content) if event.data.choices else ""
+        if not delta:
+            continue
+        content += delta
+        fields = _completed_fields(content)
+        if len(fields) > emitted:
+            emitted = len(fields)
+            yield {**fields, "lacuna_type": lacuna_type}
+
+    _write_cache(user_prompt, content)
+    yield parse_interpretation(content, lacuna_type)
+
+
+async def interpret_lacuna_async(
+    concept_id: str,
+    concept_label: str,
+    definitions: Dict[str, str],
+    neighbors: Dict[str, List[Dict]],
+    position: Dict[str, List[float]],
+    is_ghost: Dict[str, bool],
+    cluster: str,
+    primary_language: str = "en",
+    comparison_language: str = "de",
+) -> Dict:
+    """
+    Async version of interpret_lacuna.
+
+    Takes the same arguments and returns the same dict.
+    """
+    client = get_async_client()
+
+    user_prompt, lacuna_type = build_interpretation_prompt(
+        concept_id=concept_id,
+        concept_label=concept_label,
+        definitions=definitions,
+        neighbors=neighbors,
+        position=position,
+        is_ghost=is_ghost,
+        cluster=cluster,
+        primary_language=primary_language,
+        comparison_language=comparison_language,
+    )
+
+    cached = _read_cache(user_prompt)
+    if cached is not None:
+        print(f"[interpreter] Cache hit for {concept_id}")
+        return parse_interpretation(cached, lacuna_type)
+
+    print(f"[interpreter] Generating interpretation for {concept_id}...")
+
+    response = await client.chat.complete_async(
+        model=INTERPRETER_MODEL,
+        messages=build_messages(user_prompt),
+        response_format={"type": "json_object"},
+    )
+
+    content = response.choices[0].message.content
+    _write_cache(user_prompt, content)
+    return parse_interpretation(content, lacuna_type)
+
+
+def build_neighbor_index(
+    all_concepts: List[Dict],
+    languages: List[str],
+) -> Dict[str, Tuple[np.ndarray, List[str], np.ndarray]]:
+    """
+    Per-language neighbor lookup tables for a corpus.
+
+    Build once and pass to concept_card_context when interpreting many
+    concepts from the same corpus, instead of re-walking it per card.
+
+    Returns:
+        {lang: (ids, labels, positions)} over concepts placed in that
+        language; positions is an (N, 2) array
+    """
+    index = {}
+    for lang in languages:
+        placed = [c for c in all_concepts if c["position"].get(lang)]
+        index[lang] = (
+            np.array([c["id"] for c in placed]),
+            [c["labels"].get(lang, c["id"]) for c in placed],
+            np.array([c["position"][lang][:2] for c in placed], dtype=float).reshape(-1, 2),
+        )
+    return index
+
+
+def concept_card_context(
     concept: Dict,
     all_concepts: List[Dict],
     language: str = "en",
     comparison_language: str = "de",
     k_neighbors: int = 8,
+    neighbor_index: Optional[Dict] = None,
 ) -> Dict:
     """
-    Generate full interpretation for a concept card.
+    Gather the interpret_lacuna arguments for a concept card.
 
     Args:
         concept: The concept dictionary
@@ -216,12 +583,13 @@ def interpret_concept_card(
         language: Primary language being viewed
         comparison_language: Language to compare against
         k_neighbors: Number of neighbors to include
+        neighbor_index: Prebuilt build_neighbor_index(all_concepts, ...) result
 
     Returns:
-        Full interpretation dict
+        Keyword arguments for interpret_lacuna / build_interpretation_prompt
     """
-    from lib.embeddings import embed_texts
-    import numpy as np
+    if neighbor_index is None:
+        neighbor_index = build_neighbor_index(all_concepts, [language, comparison_language])
 
     # Get neighbors by position proximity
     def get_neighbors(lang: str) -> List[Dict]:
@@ -229,31 +597,36 @@ def interpret_concept_card(
         if not pos:
             return []
 
+        ids, labels, positions = neighbor_index[lang]
+        others = np.flatnonzero(ids != concept["id"])
+        k = min(k_neighbors, len(others))
+        if k <= 0:
+            return []
+
+        dists = np.linalg.norm(positions[others] - np.asarray(pos[:2], dtype=float), axis=1)
+        # Top-k without sorting the whole corpus; ties keep corpus order
+        kth = np.partition(dists, k - 1)[k - 1]
+        top = np.flatnonzero(dists <= kth)
+        top = top[np.argsort(dists[top], kind="stable")][:k]
+
         neighbors = []
-        for c in all_concepts:
-            if c["id"] == concept["id"]:
-                continue
-            c_pos = c["position"].get(lang)
-            if not c_pos:
-                continue
-
-            dist = ((pos[0] - c_pos[0])**2 + (pos[1] - c_pos[1])**2)**0.5
+        for t in top:
+            i = others[t]
+            dist = float(dists[t])
             neighbors.append({
-                "id": c["id"],
-                "label": c["labels"].get(lang, c["id"]),
+                "id": str(ids[i]),
+                "label": labels[i],
                 "similarity": 1 / (1 + dist),  # Convert distance to similarity-like score
                 "distance": dist,
             })
-
-        neighbors.sort(key=lambda x: x["distance"])
-        return neighbors[:k_neighbors]
+        return neighbors
 
     neighbors = {
         language: get_neighbors(language),
         comparison_language: get_neighbors(comparison_language),
     }
 
-    return interpret_lacuna(
+    return dict(
         concept_id=concept["id"],
         concept_label=concept["labels"].get(language, concept["id"]),
         definitions=concept.get("definitions", {}),
@@ -266,13 +639,206 @@ def interpret_concept_card(
     )
 
 
+def interpret_concept_card(
+    concept: Dict,
+    all_concepts: List[Dict],
+    language: str = "en",
+    comparison_language: str = "de",
+    k_neighbors: int = 8,
+) -> Dict:
+    """
+    Generate full interpretation for a concept card.
+
+    Args:
+        concept: The concept dictionary
+        all_concepts: All concepts (for neighbor calculation)
+        language: Primary language being viewed
+        comparison_language: Language to compare against
+        k_neighbors: Number of neighbors to include
+
+    Returns:
+        Full interpretation dict
+    """
+    return interpret_lacuna(**concept_card_context(
+        concept, all_concepts, language, comparison_language, k_neighbors
+    ))
+
+
+async def interpret_many(
+    concepts: List[Dict],
+    all_concepts: List[Dict],
+    language: str = "en",
+    comparison_language: str = "de",
+    k_neighbors: int = 8,
+    concurrency: int = INTERPRETER_CONCURRENCY,
+) -> Dict[str, Dict]:
+    """
+    Interpret many concept cards with concurrent chat calls.
+
+    Unlike interpret_lacunae_batch there is no queueing delay: wall time is
+    roughly that of the slowest request rather than the sum of all of them.
+
+    Args:
+        concepts: Concepts to interpret
+        all_concepts: All concepts (for neighbor calculation)
+        language: Primary language being viewed
+        comparison_language: Language to compare against
+        k_neighbors: Number of neighbors to include
+        concurrency: Max Mistral requests in flight at once
+
+    Returns:
+        {concept_id: interpretation dict}, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    neighbor_index = build_neighbor_index(all_concepts, [language, comparison_language])
+
+    async def run(concept: Dict) -> Dict:
+        async with semaphore:
+            return await interpret_lacuna_async(**concept_card_context(
+                concept, all_concepts, language, comparison_language, k_neighbors,
+                neighbor_index=neighbor_index,
+            ))
+
+    # Submit same-cluster concepts back to back: their prompts share the
+    # longest prefix (system prompt + cluster line)
+    order = sorted(range(len(concepts)), key=lambda i: concepts[i].get("cluster", ""))
+    results = await asyncio.gather(*(run(concepts[i]) for i in order))
+    by_position = dict(zip(order, results))
+    return {c["id"]: by_position[i] for i, c in enumerate(concepts)}
+
+
+def interpret_lacunae_batch(
+    concepts: List[Dict],
+    all_concepts: List[Dict],
+    language: str = "en",
+    comparison_language: str = "de",
+    k_neighbors: int = 8,
+    poll_interval: float = 5.0,
+    timeout: float = 3600.0,
+) -> Dict[str, Dict]:
+    """
+    Interpret many concept cards through Mistral batch inference.
+
+    Submits every prompt as one batch job instead of one chat call per
+    concept: cheaper and higher throughput for bulk runs, at the cost of
+    queueing latency. A single concept goes through interpret_lacuna.
+
+    Args:
+        concepts: Concepts to interpret
+        all_concepts: All concepts (for neighbor calculation)
+        language: Primary language being viewed
+        comparison_language: Language to compare against
+        k_neighbors: Number of neighbors to include
+        poll_interval: Seconds between job status checks
+        timeout: Seconds to wait for the batch job before cancelling it
+
+    Returns:
+        {concept_id: interpretation dict}, in input order
+
+    Raises:
+        TimeoutError: The job was still queued or running after timeout
+    """
+    if len(concepts) == 1:
+        concept = concepts[0]
+        return {concept["id"]: interpret_concept_card(
+            concept, all_concepts, language, comparison_language, k_neighbors
+        )}
+
+    # One JSONL request per uncached concept, keyed by concept id
+    results = {}
+    prompts = {}
+    lacuna_types = {}
+    lines = []
+    neighbor_index = build_neighbor_index(all_concepts, [language, comparison_language])
+    # Same-cluster concepts adjacent, for shared-prefix caching
+    for concept in sorted(concepts, key=lambda c: c.get("cluster", "")):
+        user_prompt, lacuna_type = build_interpretation_prompt(**concept_card_context(
+            concept, all_concepts, language, comparison_language, k_neighbors,
+            neighbor_index=neighbor_index,
+        ))
+        cached = _read_cache(user_prompt)
+        if cached is not None:
+            results[concept["id"]] = parse_interpretation(cached, lacuna_type)
+            continue
+        prompts[concept["id"]] = user_prompt
+        lacuna_types[concept["id"]] = lacuna_type
+        lines.append(orjson.dumps({
+            "custom_id": concept["id"],
+            "body": {
+                "messages": build_messages(user_prompt),
+                "response_format": {"type": "json_object"},
+            },
+        }).decode())
+
+    if results:
+        print(f"[interpreter] {len(results)}/{len(concepts)} interpretations served from cache")
+    if not lines:
+        return {c["id"]: results[c["id"]] for c in concepts}
+
+    client = get_client()
+    batch_file = client.files.upload(
+        file={
+            "file_name": "lacuna_interpretations.jsonl",
+            "content": "\n".join(lines).encode("utf-8"),
+        },
+        purpose="batch",
+    )
+    job = client.batch.jobs.create(
+        input_files=[batch_file.id],
+        model=INTERPRETER_MODEL,
+        endpoint="/v1/chat/completions",
+    )
+    print(f"[interpreter] Submitted batch job {job.id} for {len(lines)} concepts...")
+
+    deadline = time.monotonic() + timeout
+    while job.status in ("QUEUED", "RUNNING"):
+        if time.monotonic() >= deadline:
+            client.batch.jobs.cancel(job_id=job.id)
+            raise TimeoutError(f"Batch job {job.id} still {job.status} after {timeout:.0f}s, cancelled")
+        time.sleep(poll_interval)
+        job = client.batch.jobs.get(job_id=job.id)
+
+    if job.status != "SUCCESS" or not job.output_file:
+        raise RuntimeError(f"Batch job {job.id} finished with status {job.status}")
+
+    output = client.files.download(file_id=job.output_file).read().decode("utf-8")
+
+    fetched = 0
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        concept_id = record.get("custom_id")
+        body = (record.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if concept_id not in lacuna_types or not choices:
+            print(f"[interpreter] No batch result for {concept_id}: {record.get('error')}")
+            continue
+        content = choices[0]["message"]["content"]
+        _write_cache(prompts[concept_id], content)
+        results[concept_id] = parse_interpretation(content, lacuna_types[concept_id])
+        fetched += 1
+
+    print(f"[interpreter] Batch job {job.id} returned {fetched}/{len(lines)} interpretations")
+
+    # Concepts the batch had no answer for: one direct chat call each
+    for concept in concepts:
+        if concept["id"] not in results:
+            print(f"[interpreter] Retrying {concept['id']} outside the batch...")
+            results[concept["id"]] = interpret_concept_card(
+                concept, all_concepts, language, comparison_language, k_neighbors
+            )
+
+    return {c["id"]: results[c["id"]] for c in concepts}
+
+
 # CLI interface
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Interpret concept lacunae")
     parser.add_argument("concepts", type=Path, help="Concepts JSON file")
-    parser.add_argument("concept_id", help="Concept ID to interpret")
+    parser.add_argument("concept_id", nargs="+", help="Concept ID(s) to interpret")
     parser.add_argument("--lang", "-l", default="en", help="Primary language")
     parser.add_argument("--compare", "-c", default="de", help="Comparison language")
     parser.add_argument("--output", "-o", type=Path, help="Output JSON file")
@@ -280,29 +846,29 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Load concepts
-    with open(args.concepts) as f:
-        concepts = json.load(f)
+    concepts = orjson.loads(args.concepts.read_bytes())
 
-    # Find concept
-    concept = next((c for c in concepts if c["id"] == args.concept_id), None)
-    if not concept:
-        print(f"Concept '{args.concept_id}' not found")
+    # Find concepts
+    by_id = {c["id"]: c for c in concepts}
+    missing = [cid for cid in args.concept_id if cid not in by_id]
+    if missing:
+        print(f"Concept '{missing[0]}' not found")
         sys.exit(1)
 
     # Generate interpretation
     from dotenv import load_dotenv
     load_dotenv(Path(__file__).parent.parent / ".env")
 
-    interpretation = interpret_concept_card(
-        concept=concept,
+    # Always {concept_id: interpretation}; several ids go through one batch job
+    interpretation = interpret_lacunae_batch(
+        concepts=[by_id[cid] for cid in args.concept_id],
         all_concepts=concepts,
         language=args.lang,
         comparison_language=args.compare,
     )
 
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(interpretation, f, indent=2, ensure_ascii=False)
+        args.output.write_bytes(orjson.dumps(interpretation, option=orjson.OPT_INDENT_2))
         print(f"Written to {args.output}")
     else:
-        print(json.dumps(interpretation, indent=2, ensure_ascii=False))
+        print(orjson.dumps(interpretation, option=orjson.OPT_INDENT_2).decode())
@@ -15,15 +15,20 @@ Math validates:
 
 Usage:
     from agents.validator import validate_frames
-    result = validate_frames(frames, reference_embeddings)
+    result = await validate_frames(frames, reference_embeddings)
 """
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+import httpx
 import numpy as np
+import orjson
 
 from mistralai import Mistral
 
@@ -31,16 +36,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.schemas import ExtractedFrame, ValidatedFrame, ValidationResult
 from lib.embeddings import (
-    embed_texts,
+    embed_texts_async,
     cosine_similarity_matrix,
     find_duplicates,
     compute_uniformity_score,
-    compute_extremity_score,
+    compute_extremity_scores,
+    stack_by_language,
+    mean_pairwise_language_similarity,
 )
 
 
-# Mistral client (lazy init)
+# Mistral clients (lazy init). The async one is bound to the event loop
+# it was created on, so a new asyncio.run() gets a fresh client.
 _client = None
+_async_client = None
+_async_client_loop = None
 
 
 def get_client() -> Mistral:
@@ -54,6 +64,23 @@ def get_client() -> Mistral:
     return _client
 
 
+def get_async_client() -> Mistral:
+    """Get or create Mistral client for the running event loop."""
+    global _async_client, _async_client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _async_client is None or loop is not _async_client_loop:
+        api_key = os.environ.get("MISTRAL_API_KEY")
+        if not api_key:
+            raise ValueError("MISTRAL_API_KEY environment variable not set")
+        http_client = httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=10.0))
+        _async_client = Mistral(api_key=api_key, async_client=http_client)
+        _async_client_loop = loop
+    return _async_client
+
+
 VALIDATION_SYSTEM_PROMPT = """You are a semantic validator for the LACUNA conceptual topology project.
 
 Your task is to review extracted conceptual frames and identify which should be REJECTED.
@@ -83,22 +110,18 @@ Only include frames that should be REJECTED. If all frames are valid, return {"r
 """
 
 
-def llm_validate_frames(
-    frames: List[ExtractedFrame],
-    languages: List[str] = ["en", "de"],
-) -> Dict[str, str]:
-    """
-    Use Mistral LLM to validate frames semantically.
+VALIDATION_MODEL = "mistral-large-latest"
 
-    Returns:
-        Dict mapping frame_id -> rejection_reason (only for rejected frames)
-    """
-    if not frames:
-        return {}
+# Frames per LLM review request, and max requests in flight
+VALIDATOR_LLM_BATCH = int(os.environ.get("LACUNA_VALIDATOR_LLM_BATCH", "8"))
+VALIDATOR_CONCURRENCY = int(os.environ.get("LACUNA_VALIDATOR_CONCURRENCY", "4"))
 
-    client = get_client()
 
-    # Format frames for LLM review
+def build_validation_messages(
+    frames: List[ExtractedFrame],
+    languages: List[str],
+) -> List[Dict[str, str]]:
+    """Build the chat messages asking the LLM which frames to reject."""
     frames_text = []
     for f in frames:
         frame_desc = f"ID: {f.id}\n"
@@ -119,21 +142,16 @@ def llm_validate_frames(
 
 Identify which frames should be REJECTED and why. Return JSON only."""
 
-    print(f"[validator] LLM validating {len(frames)} frames...")
-
-    response = client.chat.complete(
-        model="mistral-large-latest",
-        messages=[
-            {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format={"type": "json_object"},
-    )
+    return [
+        {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
 
-    content = response.choices[0].message.content
 
+def parse_validation_response(content: str) -> Dict[str, str]:
+    """Parse the LLM response into frame_id -> rejection_reason."""
     try:
-        result = json.loads(content)
+        result = orjson.loads(content)
         rejections = result.get("rejections", [])
 
         rejection_map = {}
@@ -147,17 +165,95 @@ Identify which frames should be REJECTED and why. Return JSON only."""
 
         return rejection_map
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"[validator] LLM returned invalid JSON, skipping LLM validation")
         return {}
 
 
+def llm_validate_frames(
+    frames: List[ExtractedFrame],
+    languages: List[str] = ["en", "de"],
+) -> Dict[str, str]:
+    """
+    Use Mistral LLM to validate frames semantically.
+
+    Returns:
+        Dict mapping frame_id -> rejection_reason (only for rejected frames)
+    """
+    if not frames:
+        return {}
+
+    client = get_client()
+    messages = build_validation_messages(frames, languages)
+
+    print(f"[validator] LLM validating {len(frames)} frames...")
+
+    response = client.chat.complete(
+        model=VALIDATION_MODEL,
+        messages=messages,
+        response_format={"type": "json_object"},
+    )
+
+    return parse_validation_response(response.choices[0].message.content)
+
+
+async def llm_validate_frames_async(
+    frames: List[ExtractedFrame],
+    languages: List[str] = ["en", "de"],
+    batch_size: int = VALIDATOR_LLM_BATCH,
+    concurrency: int = VALIDATOR_CONCURRENCY,
+) -> Dict[str, str]:
+    """
+    Async version of llm_validate_frames.
+
+    Frames are reviewed in sub-batches of batch_size, at most concurrency
+    requests in flight, so wall time tracks the slowest sub-batch rather
+    than one long prompt. Redundancy across sub-batches is left to the
+    embedding duplicate check. A failed sub-batch is logged and skipped.
+
+    Returns:
+        Dict mapping frame_id -> rejection_reason (only for rejected frames)
+    """
+    if not frames:
+        return {}
+
+    client = get_async_client()
+    batch_size = max(1, batch_size)
+    batches = [frames[i:i + batch_size] for i in range(0, len(frames), batch_size)]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    print(f"[validator] LLM validating {len(frames)} frames in {len(batches)} batches...")
+
+    async def review(batch: List[ExtractedFrame]) -> Dict[str, str]:
+        async with semaphore:
+            response = await client.chat.complete_async(
+                model=VALIDATION_MODEL,
+                messages=build_validation_messages(batch, languages),
+                response_format={"type": "json_object"},
+            )
+        return parse_validation_response(response.choices[0].message.content)
+
+    results = await asyncio.gather(*(review(b) for b in batches), return_exceptions=True)
+
+    rejection_map = {}
+    for batch, result in zip(batches, results):
+        if isinstance(result, BaseException):
+            print(f"[validator] LLM batch of {len(batch)} frames failed: {result}")
+            continue
+        rejection_map.update(result)
+    return rejection_map
+
+
 # Validation thresholds
 DUPLICATE_THRESHOLD = 0.85  # Cosine similarity above this = duplicate
 CROSS_LANG_SIMILARITY_MAX = 0.92  # If EN/DE embeddings too similar = no structural difference (boring)
 UNIFORMITY_MIN = 0.3  # Below this = too generic
 EXTREMITY_MIN = 0.35  # Below this = outlier
 CONFIDENCE_MIN = 0.5  # Extraction confidence minimum
+LLM_MIN_FRAMES = 3  # Fewer frames than this = skip the LLM review (nothing to compare against)
+
+# Per-concept detail logging (LACUNA_VALIDATOR_VERBOSE=1 or --verbose)
+VALIDATOR_VERBOSE = os.environ.get("LACUNA_VALIDATOR_VERBOSE", "0") == "1"
 
 
 def compute_cross_language_similarity(
@@ -176,37 +272,20 @@ def compute_cross_language_similarity(
     if len(languages) < 2:
         return {}
 
-    # Build lookup: concept_id -> {lang: embedding}
-    concept_embeddings: Dict[str, Dict[str, np.ndarray]] = {}
-    for lang, (ids, embeddings) in embeddings_by_lang.items():
-        for i, id_ in enumerate(ids):
-            if id_ not in concept_embeddings:
-                concept_embeddings[id_] = {}
-            concept_embeddings[id_][lang] = embeddings[i]
-
-    # Compute cross-language similarity for each concept
-    cross_lang_sims = {}
-    for concept_id, lang_embs in concept_embeddings.items():
-        if len(lang_embs) < 2:
-            continue
+    # One row per concept, one normalized matrix per language
+    ids, _, normalized, present = stack_by_language(embeddings_by_lang)
+    similarity, pair_count = mean_pairwise_language_similarity(normalized, present)
 
-        # Get all pairs of languages
-        langs = list(lang_embs.keys())
-        sims = []
-        for i in range(len(langs)):
-            for j in range(i + 1, len(langs)):
-                emb1 = lang_embs[langs[i]]
-                emb2 = lang_embs[langs[j]]
-                # Cosine similarity
-                sim = float(np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2) + 1e-10))
-                sims.append(sim)
-
-        cross_lang_sims[concept_id] = float(np.mean(sims)) if sims else 0.0
+    cross_lang_sims = {
+        id_: float(sim)
+        for id_, sim, count in zip(ids, similarity, pair_count)
+        if count > 0
+    }
 
     return cross_lang_sims
 
 
-def validate_frames(
+async def validate_frames(
     frames: List[ExtractedFrame],
     reference_embeddings: Optional[np.ndarray] = None,
     languages: List[str] = ["en", "de"],
@@ -220,6 +299,9 @@ def validate_frames(
     """
     Validate extracted frames using LLM + embedding-based filtering.
 
+    The LLM review runs concurrently with the embedding checks; its
+    rejections are merged in before the final filter pass.
+
     Args:
         frames: List of extracted frames to validate
         reference_embeddings: Optional existing embeddings to check against
@@ -249,14 +331,31 @@ def validate_frames(
         else:
             confident_frames.append(frame)
 
-    # LLM semantic validation
-    llm_rejections = {}
-    if use_llm and confident_frames:
-        try:
-            llm_rejections = llm_validate_frames(confident_frames, languages)
-            rejection_reasons.update(llm_rejections)
-        except Exception as e:
-            print(f"[validator] LLM validation failed: {e}, continuing with math only")
+    # Exact duplicate definitions: reject before spending LLM/embedding work
+    seen_definitions: Dict[Tuple[str, bytes], str] = {}
+    unique_frames = []
+    for frame in confident_frames:
+        duplicate_of = None
+        keys = []
+        for lang, definition in frame.definitions.items():
+            key = (lang, hashlib.blake2b(definition.encode("utf-8"), digest_size=8).digest())
+            if key in seen_definitions:
+                duplicate_of = seen_definitions[key]
+                break
+            keys.append(key)
+        if duplicate_of is not None:
+            rejected.append(frame)
+            rejection_reasons[frame.id] = f"Exact-duplicate definition of {duplicate_of}"
+            continue
+        for key in keys:
+            seen_definitions[key] = frame.id
+        unique_frames.append(frame)
+    confident_frames = unique_frames
+
+    # LLM semantic validation, in the background while we embed
+    llm_task = None
+    if use_llm and len(confident_frames) >= LLM_MIN_FRAMES:
+        llm_task = asyncio.create_task(llm_validate_frames_async(confident_frames, languages))
 
     if not confident_frames:
         return ValidationResult(
@@ -265,74 +364,132 @@ def validate_frames(
             rejection_reasons=rejection_reasons
         )
 
-    # Embed all frames per language
-    embeddings_by_lang: Dict[str, Tuple[List[str], np.ndarray]] = {}
-
-    for lang in languages:
-        # Get definitions for this language
-        ids = []
-        definitions = []
-        for frame in confident_frames:
-            if lang in frame.definitions:
-                ids.append(frame.id)
-                definitions.append(frame.definitions[lang])
-
-        if not definitions:
-            continue
-
-        print(f"[validator] Embedding {len(definitions)} frames for {lang}...")
-        embeddings = embed_texts(definitions)
-        embeddings_by_lang[lang] = (ids, embeddings)
-
-    # Check for duplicates within extracted set
-    duplicate_ids = set()
-    for lang, (ids, embeddings) in embeddings_by_lang.items():
-        duplicates = find_duplicates(embeddings, duplicate_threshold)
-        for i, j, sim in duplicates:
-            # Keep the first one, reject the second
-            dup_id = ids[j]
-            duplicate_ids.add(dup_id)
-            if dup_id not in rejection_reasons:
-                rejection_reasons[dup_id] = f"Duplicate of {ids[i]} ({lang}, cos={sim:.3f})"
-
-    # Check uniformity (are embeddings too similar to each other?)
-    uniformity_scores = {}
-    for lang, (ids, embeddings) in embeddings_by_lang.items():
-        uniformity = compute_uniformity_score(embeddings)
-        uniformity_scores[lang] = uniformity
-        print(f"[validator] {lang} uniformity score: {uniformity:.3f}")
-
-        if uniformity < uniformity_min:
-            print(f"[validator] WARNING: {lang} embeddings are too uniform - definitions may be too generic")
-
-    # Check cross-language similarity - kill concepts that don't show structural difference
-    cross_lang_sims = compute_cross_language_similarity(embeddings_by_lang, languages)
-    boring_ids = set()
-    for concept_id, sim in cross_lang_sims.items():
-        if sim > cross_lang_max:
-            boring_ids.add(concept_id)
-            rejection_reasons[concept_id] = f"No structural difference across languages (cross-lang sim={sim:.3f} > {cross_lang_max})"
-            print(f"[validator] REJECT {concept_id}: too similar across languages ({sim:.3f})")
-        else:
-            print(f"[validator] {concept_id}: cross-lang similarity {sim:.3f} (OK)")
-
-    # Check extremity against reference (if provided)
-    extremity_scores = {}
-    if reference_embeddings is not None:
+    # Everything up to awaiting llm_task runs in try: if it raises, cancel
+    # the LLM request instead of leaving it running with no owner
+    try:
+        # Embed all frames, every language in one embed_texts call (one model
+        # pass instead of one per language), then split per language
+        lang_spans: Dict[str, Tuple[List[str], int, int]] = {}
+        all_definitions = []
+        for lang in languages:
+            # Get definitions for this language
+            ids = []
+            for frame in confident_frames:
+                if lang in frame.definitions:
+                    ids.append(frame.id)
+                    all_definitions.append(frame.definitions[lang])
+            if ids:
+                lang_spans[lang] = (ids, len(all_definitions) - len(ids), len(all_definitions))
+
+        embeddings_by_lang: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        if all_definitions:
+            counts = ", ".join(f"{len(ids)} {lang}" for lang, (ids, _, _) in lang_spans.items())
+            print(f"[validator] Embedding {len(all_definitions)} definitions ({counts})...")
+            # Unit rows (embed_texts normalizes), so every check below is a
+            # plain dot product
+            # (off the event loop so the LLM request keeps making progress;
+            # concurrent validations share a model call)
+            all_embeddings = await embed_texts_async(all_definitions)
+            for lang, (ids, start, stop) in lang_spans.items():
+                embeddings_by_lang[lang] = (ids, all_embeddings[start:stop])
+
+        # Pairwise checks need at least two frames; a single frame goes
+        # straight to the per-concept checks (cross-language, extremity)
+        pairwise = len(confident_frames) > 1
+
+        # Check for duplicates within extracted set
+        duplicate_ids = set()
         for lang, (ids, embeddings) in embeddings_by_lang.items():
-            for i, (id_, emb) in enumerate(zip(ids, embeddings)):
-                score = compute_extremity_score(emb, reference_embeddings)
-                extremity_scores[id_] = extremity_scores.get(id_, []) + [score]
-
-    # Build validated frames
-    frame_lookup = {f.id: f for f in confident_frames}
-    frame_embeddings: Dict[str, Dict[str, List[float]]] = {}
+            if not pairwise:
+                break
+            duplicates = find_duplicates(embeddings, duplicate_threshold, normalized=True)
+            for i, j, sim in duplicates:
+                # Keep the first one, reject the second
+                dup_id = ids[j]
+                duplicate_ids.add(dup_id)
+                if dup_id not in rejection_reasons:
+                    rejection_reasons[dup_id] = f"Duplicate of {ids[i]} ({lang}, cos={sim:.3f})"
+
+        # Check uniformity (are embeddings too similar to each other?)
+        uniformity_scores = {}
+        for lang, (ids, embeddings) in embeddings_by_lang.items():
+            if not pairwise:
+                break
+            uniformity = compute_uniformity_score(embeddings, normalized=True)
+            uniformity_scores[lang] = uniformity
+            print(f"[validator] {lang} uniformity score: {uniformity:.3f}")
+
+            if uniformity < uniformity_min:
+                print(f"[validator] WARNING: {lang} embeddings are too uniform - definitions may be too generic")
+
+        # Check cross-language similarity - kill concepts that don't show structural difference
+        cross_lang_sims = compute_cross_language_similarity(embeddings_by_lang, languages)
+        sim_ids = list(cross_lang_sims)
+        sims = np.fromiter(cross_lang_sims.values(), dtype=float, count=len(sim_ids))
+        is_boring = sims > cross_lang_max
+        boring_ids = set()
+        details = []
+        for concept_id, sim, boring in zip(sim_ids, sims, is_boring):
+            if boring:
+                boring_ids.add(concept_id)
+                rejection_reasons[concept_id] = f"No structural difference across languages (cross-lang sim={sim:.3f} > {cross_lang_max})"
+                details.append(f"[validator] REJECT {concept_id}: too similar across languages ({sim:.3f})")
+            elif VALIDATOR_VERBOSE:
+                details.append(f"[validator] {concept_id}: cross-lang similarity {sim:.3f} (OK)")
+
+        # One summary line; per-concept detail only in verbose mode
+        if VALIDATOR_VERBOSE and details:
+            print("\n".join(details))
+        print(f"[validator] cross-lang OK={len(sim_ids) - len(boring_ids)} REJECT={len(boring_ids)}")
+        if boring_ids and not VALIDATOR_VERBOSE:
+            rejected_ids = [cid for cid, boring in zip(sim_ids, is_boring) if boring]
+            more = f" (+{len(rejected_ids) - 10} more)" if len(rejected_ids) > 10 else ""
+            print(f"[validator] cross-lang REJECT: {', '.join(rejected_ids[:10])}{more}")
+
+        # Check extremity against reference (if provided)
+        extremity_scores = {}
+        if reference_embeddings is not None:
+            reference_embeddings = reference_embeddings / (
+                np.linalg.norm(reference_embeddings, axis=1, keepdims=True) + 1e-10
+            )
+            for lang, (ids, embeddings) in embeddings_by_lang.items():
+                scores = compute_extremity_scores(embeddings, reference_embeddings, normalized=True)
+                for id_, score in zip(ids, scores):
+                    extremity_scores.setdefault(id_, []).append(float(score))
+
+        # Build validated frames
+        frame_lookup = {f.id: f for f in confident_frames}
+        # Row of each concept in its language matrix; embeddings stay in the
+        # per-language arrays and are converted to lists only for valid frames
+        rows_by_lang = {
+            lang: {id_: row for row, id_ in enumerate(ids)}
+            for lang, (ids, _) in embeddings_by_lang.items()
+        }
+
+        def frame_embeddings(frame_id: str) -> Dict[str, List[float]]:
+            return {
+                lang: embeddings_by_lang[lang][1][rows[frame_id]].tolist()
+                for lang, rows in rows_by_lang.items()
+                if frame_id in rows
+            }
+    except BaseException:
+        if llm_task is not None:
+            llm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await llm_task
+        raise
 
-    for lang, (ids, embeddings) in embeddings_by_lang.items():
-        for id_, emb in zip(ids, embeddings):
-            if id_ not in frame_embeddings:
-                frame_embeddings[id_] = {}
-            frame_embeddings[id_][lang] = emb.tolist()
+    llm_rejections = {}
+    if llm_task is not None:
+        try:
+            llm_rejections = await llm_task
+        except Exception as e:
+            print(f"[validator] LLM validation failed: {e}, continuing with math only")
+    # LLM reasons take precedence over duplicate reasons, but the
+    # cross-language rejection is reported for boring concepts
+    rejection_reasons.update(
+        {id_: reason for id_, reason in llm_rejections.items() if id_ not in boring_ids}
+    )
 
     # Final validation pass
     for frame in confident_frames:
@@ -359,16 +516,18 @@ def validate_frames(
                 rejection_reasons[frame.id] = f"Outlier (extremity={avg_extremity:.3f})"
                 continue
 
-        # Frame is valid
-        validated = ValidatedFrame(
+        # Frame is valid. Every field is already the right type (the frame
+        # was validated as an ExtractedFrame, embeddings come from .tolist()),
+        # so skip re-validating 1024 floats per language.
+        validated = ValidatedFrame.model_construct(
             id=frame.id,
             labels=frame.labels,
             definitions=frame.definitions,
             cluster=frame.cluster,
-            embeddings=frame_embeddings.get(frame.id, {}),
+            embeddings=frame_embeddings(frame.id),
             validation_scores={
-                "confidence": frame.confidence,
-                "extremity": np.mean(extremity_scores.get(frame.id, [1.0])),
+                "confidence": float(frame.confidence),
+                "extremity": float(np.mean(extremity_scores.get(frame.id, [1.0]))),
             }
         )
         valid.append(validated)
@@ -382,7 +541,17 @@ def validate_frames(
     )
 
 
-def validate_against_existing(
+def validate_frames_sync(
+    frames: List[ExtractedFrame],
+    reference_embeddings: Optional[np.ndarray] = None,
+    languages: List[str] = ["en", "de"],
+    **kwargs,
+) -> ValidationResult:
+    """Synchronous wrapper for validate_frames."""
+    return asyncio.run(validate_frames(frames, reference_embeddings, languages, **kwargs))
+
+
+async def validate_against_existing(
     frames: List[ExtractedFrame],
     existing_concepts_path: Path,
     languages: List[str] = ["en", "de"],
@@ -398,56 +567,50 @@ def validate_against_existing(
     Returns:
         ValidationResult
     """
-    import json
-
     # Load existing concepts
-    with open(existing_concepts_path) as f:
-        existing = json.load(f)
+    existing = orjson.loads(Path(existing_concepts_path).read_bytes())
 
-    # Embed existing definitions
-    all_existing_embeddings = []
+    # Embed existing definitions, all languages in one call
+    definitions = []
     for lang in languages:
-        definitions = []
         for c in existing:
             if "definitions" in c and lang in c["definitions"]:
                 definitions.append(c["definitions"][lang])
-        if definitions:
-            embeddings = embed_texts(definitions)
-            all_existing_embeddings.append(embeddings)
 
-    if all_existing_embeddings:
-        reference_embeddings = np.vstack(all_existing_embeddings)
+    if definitions:
+        reference_embeddings = await embed_texts_async(definitions)
     else:
         reference_embeddings = None
 
-    return validate_frames(frames, reference_embeddings, languages)
+    return await validate_frames(frames, reference_embeddings, languages)
 
 
 # CLI interface
 if __name__ == "__main__":
     import argparse
-    import json
 
     parser = argparse.ArgumentParser(description="Validate extracted frames")
     parser.add_argument("input", type=Path, help="Input frames JSON file")
     parser.add_argument("--output", "-o", type=Path, help="Output JSON file")
     parser.add_argument("--reference", "-r", type=Path, help="Reference concepts JSON")
     parser.add_argument("--languages", "-l", nargs="+", default=["en", "de"])
+    parser.add_argument("--verbose", "-v", action="store_true", help="Per-concept validation details")
 
     args = parser.parse_args()
+    if args.verbose:
+        VALIDATOR_VERBOSE = True
 
     # Load frames
-    with open(args.input) as f:
-        data = json.load(f)
+    data = orjson.loads(args.input.read_bytes())
 
     frames = [ExtractedFrame(**f) for f in data]
     print(f"[validator] Loaded {len(frames)} frames")
 
     # Validate
     if args.reference:
-        result = validate_against_existing(frames, args.reference, args.languages)
+        result = asyncio.run(validate_against_existing(frames, args.reference, args.languages))
     else:
-        result = validate_frames(frames, languages=args.languages)
+        result = validate_frames_sync(frames, languages=args.languages)
 
     # Output
     output = {
@@ -457,8 +620,9 @@ if __name__ == "__main__":
     }
 
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        args.output.write_bytes(orjson.dumps(
+            output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
         print(f"[validator] Written to {args.output}")
     else:
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        print(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode())
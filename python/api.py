@@ -14,6 +14,7 @@ Usage:
     uvicorn api:app --reload --port 8000
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -21,6 +22,7 @@ from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -42,6 +44,9 @@ app = FastAPI(
     title="LACUNA Pipeline API",
     description="Extraction and embedding pipeline for conceptual frames",
     version="1.0.0",
+    # Responses carry 1024-float embeddings per frame; orjson encodes them
+    # far faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for local development
@@ -162,7 +167,7 @@ async def validate(request: ValidateRequest):
     global _model_loaded
 
     try:
-        result = validate_frames(
+        result = await validate_frames(
             request.frames,
             languages=request.languages,
         )
@@ -185,7 +190,8 @@ async def embed(request: EmbedRequest):
     Returns full Concept objects ready for the frontend.
     """
     try:
-        concepts = validated_to_concepts(request.frames, request.languages)
+        # UMAP fit runs in a worker thread so other requests keep being served
+        concepts = await asyncio.to_thread(validated_to_concepts, request.frames, request.languages)
         return EmbedResponse(concepts=concepts)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -222,15 +228,18 @@ async def pipeline(request: PipelineRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Preload model on startup (optional, can be slow)
+# Preload model on startup so the first request doesn't pay the load
+# (PRELOAD_MODEL=false to skip, e.g. for quick local restarts)
 @app.on_event("startup")
 async def startup():
-    """Optionally preload the embedding model."""
-    preload = os.environ.get("PRELOAD_MODEL", "false").lower() == "true"
+    """Preload and warm up the embedding model."""
+    preload = os.environ.get("PRELOAD_MODEL", "true").lower() == "true"
     if preload:
         print("[api] Preloading BGE-M3 model...")
-        from lib.embeddings import get_model
-        get_model()
+        from lib.embeddings import warmup_model
+        # sentence-transformers places the model on the GPU when one is
+        # available; the warmup batch initializes its kernels
+        warmup_model()
         global _model_loaded
         _model_loaded = True
         print("[api] Model loaded.")
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     umap_metric: str = "cosine"
     umap_random_state: int = 42
     umap_n_components: int = 2
+    # Project new points as a similarity-weighted average of their nearest
+    # training points instead of UMAP .transform (faster, approximate)
+    umap_fast_projection: bool = False
 
     # Validation Thresholds
     duplicate_threshold: float = 0.85
@@ -30,6 +33,9 @@ class Settings(BaseSettings):
     # Neighbor Search
     n_neighbors: int = 8
 
+    # /embed response cache (entries keyed by language + definition; 0 = off)
+    embed_cache_size: int = 1024
+
     # File Paths
     data_dir: str = "data"
 
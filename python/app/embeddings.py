@@ -1,6 +1,7 @@
 """BGE-M3 embedding model wrapper."""
 
 import logging
+import threading
 from typing import List
 import numpy as np
 
@@ -26,6 +27,8 @@ class EmbeddingService:
         """Initialize the BGE-M3 model."""
         self.model = None
         self.use_flag_embedding = USE_FLAG_EMBEDDING
+        # One encode at a time across request worker threads
+        self._lock = threading.Lock()
         self._load_model()
 
     def _load_model(self):
@@ -61,28 +64,30 @@ class EmbeddingService:
             raise RuntimeError("BGE-M3 model not loaded")
 
         try:
-            if self.use_flag_embedding:
-                # BGE-M3 returns dict with 'dense_vecs' key containing embeddings
-                embeddings = self.model.encode(
-                    [text],
-                    batch_size=1,
-                    max_length=512  # BGE-M3 max length
-                )['dense_vecs']
-                return embeddings[0]
-            else:
-                # sentence-transformers returns numpy array directly
-                embedding = self.model.encode(text, normalize_embeddings=False)
-                return embedding
+            with self._lock:
+                if self.use_flag_embedding:
+                    # BGE-M3 returns dict with 'dense_vecs' key containing embeddings
+                    embeddings = self.model.encode(
+                        [text],
+                        batch_size=1,
+                        max_length=512  # BGE-M3 max length
+                    )['dense_vecs']
+                    return embeddings[0]
+                else:
+                    # sentence-transformers returns numpy array directly
+                    embedding = self.model.encode(text, normalize_embeddings=False)
+                    return embedding
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             raise
 
-    def embed_batch(self, texts: List[str]) -> np.ndarray:
+    def embed_batch(self, texts: List[str], show_progress: bool = False) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
 
         Args:
             texts: List of input texts to embed
+            show_progress: Show a progress bar (sentence-transformers only)
 
         Returns:
             Array of embeddings with shape (len(texts), 1024)
@@ -90,23 +95,28 @@ class EmbeddingService:
         if self.model is None:
             raise RuntimeError("BGE-M3 model not loaded")
 
+        # One forward pass for typical requests; cap keeps 512-token
+        # batches within GPU memory
+        batch_size = max(1, min(len(texts), 128))
+
         try:
-            if self.use_flag_embedding:
-                embeddings = self.model.encode(
-                    texts,
-                    batch_size=32,
-                    max_length=512
-                )['dense_vecs']
-                return embeddings
-            else:
-                # sentence-transformers batch encode
-                embeddings = self.model.encode(
-                    texts,
-                    batch_size=32,
-                    normalize_embeddings=False,
-                    show_progress_bar=True
-                )
-                return embeddings
+            with self._lock:
+                if self.use_flag_embedding:
+                    embeddings = self.model.encode(
+                        texts,
+                        batch_size=batch_size,
+                        max_length=512
+                    )['dense_vecs']
+                    return embeddings
+                else:
+                    # sentence-transformers batch encode
+                    embeddings = self.model.encode(
+                        texts,
+                        batch_size=batch_size,
+                        normalize_embeddings=False,
+                        show_progress_bar=show_progress
+                    )
+                    return embeddings
         except Exception as e:
             logger.error(f"Batch embedding generation failed: {e}")
             raise
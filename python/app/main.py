@@ -1,15 +1,21 @@
 """FastAPI application for LACUNA embedding service."""
 
+import asyncio
 import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from typing import Tuple
+import numpy as np
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
 from .models import EmbedRequest, EmbedResponse, HealthResponse
 from .embeddings import EmbeddingService
 from .umap_projection import UMAPProjector
 from .neighbors import NeighborSearch
+from lib.embeddings import BatchCoalescer
 
 # Configure logging
 logging.basicConfig(
@@ -22,12 +28,29 @@ logger = logging.getLogger(__name__)
 embedding_service = None
 umap_projector = None
 neighbor_search = None
+# Concurrent /embed requests share one embed_batch forward pass
+embedding_batcher = None
+
+# Recent /embed results by (language, definition), least recently used
+# first: the raw embedding plus the response without it
+response_cache: "OrderedDict[Tuple[str, str], Tuple[np.ndarray, EmbedResponse]]" = OrderedDict()
+
+
+def _warmup():
+    """Run one synthetic request through each service so the first real
+    /embed doesn't pay for first-call allocation and kernel setup."""
+    embedding = embedding_service.embed_batch(["warmup"])[0]
+    for lang in ["en", "de"]:
+        if umap_projector.is_available(lang):
+            umap_projector.project_and_weight(embedding, lang)
+        if neighbor_search.is_available(lang):
+            neighbor_search.find_neighbors(embedding, lang)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    global embedding_service, umap_projector, neighbor_search
+    global embedding_service, umap_projector, neighbor_search, embedding_batcher
 
     # Startup
     logger.info("Starting LACUNA embedding service...")
@@ -36,6 +59,7 @@ async def lifespan(app: FastAPI):
         # Load services in order
         logger.info("Loading BGE-M3 model...")
         embedding_service = EmbeddingService()
+        embedding_batcher = BatchCoalescer(embedding_service.embed_batch, window=0.01, max_batch=32)
 
         logger.info("Loading UMAP projector...")
         umap_projector = UMAPProjector()
@@ -43,6 +67,9 @@ async def lifespan(app: FastAPI):
         logger.info("Loading neighbor search...")
         neighbor_search = NeighborSearch()
 
+        logger.info("Warming up services...")
+        _warmup()
+
         logger.info("All services loaded successfully!")
 
     except Exception as e:
@@ -60,7 +87,8 @@ app = FastAPI(
     title="LACUNA Embedding Service",
     description="BGE-M3 embeddings with UMAP projection",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -95,13 +123,24 @@ async def health_check():
     )
 
 
+def _finish_response(
+    response: EmbedResponse, embedding: np.ndarray, include_embedding: bool
+) -> EmbedResponse:
+    """Attach the raw embedding (as floats) only when the caller asked for it."""
+    if not include_embedding:
+        return response
+    return response.model_copy(update={"embedding": embedding.tolist()})
+
+
 @app.post("/embed", response_model=EmbedResponse)
-async def embed_concept(request: EmbedRequest):
+async def embed_concept(request: EmbedRequest, include_embedding: bool = True):
     """
     Generate embedding and semantic analysis for a concept.
 
     Args:
         request: EmbedRequest with concept, language, and definition
+        include_embedding: Include the raw 1024-float embedding in the
+            response (?include_embedding=false skips it)
 
     Returns:
         EmbedResponse with embedding, position, weight, neighbors
@@ -133,37 +172,51 @@ async def embed_concept(request: EmbedRequest):
             detail=f"UMAP model for '{request.language}' not ready. Run setup scripts first."
         )
 
+    # Same definition seen recently: embedding, position, weight and
+    # neighbors are all deterministic, so reuse them
+    cache_key = (request.language, request.definition)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        response_cache.move_to_end(cache_key)
+        logger.info(f"Cache hit for '{request.concept}' ({request.language})")
+        embedding, response = cached
+        return _finish_response(
+            response.model_copy(update={"concept": request.concept}), embedding, include_embedding
+        )
+
     try:
         # Step 1: Generate embedding
         logger.info(f"Generating embedding for '{request.concept}' ({request.language})")
-        embedding = embedding_service.embed(request.definition)
-
-        # Step 2: UMAP projection
-        logger.info("Projecting to 2D space")
-        x, z = umap_projector.project(embedding, request.language)
+        # (model and UMAP run in worker threads, off the event loop; requests
+        # arriving within 10 ms are encoded together)
+        embedding = (await embedding_batcher.embed([request.definition]))[0]
+
+        # Steps 2-4 depend only on the embedding: run them concurrently
+        # (UMAP projection + semantic weight, neighbor search)
+        logger.info("Projecting, weighting and finding neighbors")
+        (x, z, weight), neighbors = await asyncio.gather(
+            asyncio.to_thread(umap_projector.project_and_weight, embedding, request.language),
+            asyncio.to_thread(neighbor_search.find_neighbors, embedding, request.language),
+        )
         position = [x, z]
 
-        # Step 3: Calculate weight
-        logger.info("Calculating semantic weight")
-        weight = umap_projector.calculate_weight(embedding, request.language)
-
-        # Step 4: Find neighbors
-        logger.info("Finding semantic neighbors")
-        neighbors = neighbor_search.find_neighbors(embedding, request.language)
-
         # Build response
         response = EmbedResponse(
             concept=request.concept,
             language=request.language,
-            embedding=embedding.tolist(),
             position=position,
             weight=weight,
             neighbors=neighbors,
             status="live"
         )
 
+        if settings.embed_cache_size > 0:
+            response_cache[cache_key] = (embedding, response)
+            if len(response_cache) > settings.embed_cache_size:
+                response_cache.popitem(last=False)
+
         logger.info(f"Successfully processed '{request.concept}'")
-        return response
+        return _finish_response(response, embedding, include_embedding)
 
     except Exception as e:
         logger.error(f"Error processing request: {e}")
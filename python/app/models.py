@@ -25,7 +25,9 @@ class EmbedResponse(BaseModel):
 
     concept: str = Field(..., description="Original concept label")
     language: str = Field(..., description="Language code")
-    embedding: List[float] = Field(..., description="1024-dimensional BGE-M3 embedding")
+    embedding: Optional[List[float]] = Field(
+        None, description="1024-dimensional BGE-M3 embedding (omitted with include_embedding=false)"
+    )
     position: List[float] = Field(..., description="[x, z] UMAP-projected position")
     weight: float = Field(..., description="Normalized L2 norm (semantic weight)")
     neighbors: List[Neighbor] = Field(..., description="Top-8 nearest neighbors")
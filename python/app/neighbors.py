@@ -5,7 +5,6 @@ import json
 from pathlib import Path
 from typing import List, Dict, Tuple
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from .config import settings
 from .models import Neighbor
@@ -21,6 +20,8 @@ class NeighborSearch:
         self.embeddings: Dict[str, np.ndarray] = {}
         self.concept_ids: Dict[str, List[str]] = {}
         self.concept_labels: Dict[str, Dict[str, str]] = {}
+        # Display label per corpus row, parallel to concept_ids
+        self.row_labels: Dict[str, np.ndarray] = {}
         self._load_data()
 
     def _load_data(self):
@@ -31,7 +32,11 @@ class NeighborSearch:
             # Load embeddings
             embeddings_path = data_dir / f"embeddings_{lang}.npy"
             if embeddings_path.exists():
-                self.embeddings[lang] = np.load(embeddings_path)
+                # Stored L2-normalized so each query is a single dot product
+                embeddings = np.load(embeddings_path).astype(np.float32)
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                self.embeddings[lang] = np.ascontiguousarray(embeddings / norms)
                 logger.info(f"Loaded {len(self.embeddings[lang])} embeddings for {lang}")
             else:
                 logger.warning(f"Embeddings not found: {embeddings_path}")
@@ -63,6 +68,13 @@ class NeighborSearch:
         else:
             logger.warning(f"Versailles concepts not found: {versailles_path}")
 
+        # Labels by row index (falling back to the concept ID)
+        for lang, ids in self.concept_ids.items():
+            labels = self.concept_labels.get(lang, {})
+            self.row_labels[lang] = np.array(
+                [labels.get(concept_id, concept_id) for concept_id in ids], dtype=object
+            )
+
     def find_neighbors(
         self,
         embedding: np.ndarray,
@@ -87,33 +99,33 @@ class NeighborSearch:
             raise ValueError(f"No embeddings available for language: {language}")
 
         try:
-            # Compute cosine similarities
-            similarities = cosine_similarity(
-                embedding.reshape(1, -1),
-                self.embeddings[language]
-            )[0]
-
-            # Get top-N indices (excluding identical match if present)
-            top_indices = np.argsort(similarities)[::-1][:n + 5]  # Get extra to filter
+            # Cosine similarities: corpus rows are unit length, so one GEMV
+            query = np.asarray(embedding, dtype=np.float32).ravel()
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+            similarities = self.embeddings[language] @ query
+
+            # Skip near-identical matches (likely the same concept) up front,
+            # so the top-N is always filled when enough other rows exist
+            eligible = np.flatnonzero(similarities <= 0.999)
+
+            # Get top-N indices: partition out the candidates, then sort only those
+            k = min(n, len(eligible))
+            if k < len(eligible):
+                candidates = eligible[np.argpartition(-similarities[eligible], k - 1)[:k]]
+            else:
+                candidates = eligible
+            top_indices = candidates[np.argsort(-similarities[candidates], kind="stable")]
 
             # Build neighbor list
             neighbors = []
             for idx in top_indices:
-                if len(neighbors) >= n:
-                    break
-
                 concept_id = self.concept_ids[language][idx]
                 similarity = float(similarities[idx])
 
-                # Skip near-identical matches (likely the same concept)
-                if similarity > 0.999:
-                    continue
-
                 # Get label
-                label = self.concept_labels.get(language, {}).get(
-                    concept_id,
-                    concept_id
-                )
+                label = self.row_labels[language][idx]
 
                 neighbors.append(
                     Neighbor(
@@ -20,6 +20,10 @@ class UMAPProjector:
         self.models: Dict[str, UMAP] = {}
         self.min_norms: Dict[str, float] = {}
         self.max_norms: Dict[str, float] = {}
+        # Fast projection only: unit-length training embeddings and their
+        # fitted 2D positions
+        self.train_embeddings: Dict[str, np.ndarray] = {}
+        self.train_positions: Dict[str, np.ndarray] = {}
         self._load_models()
 
     def _load_models(self):
@@ -41,6 +45,14 @@ class UMAPProjector:
                 self.min_norms[lang] = model_data["min_norm"]
                 self.max_norms[lang] = model_data["max_norm"]
 
+                if settings.umap_fast_projection:
+                    model = self.models[lang]
+                    train = np.asarray(model._raw_data, dtype=np.float32)
+                    norms = np.linalg.norm(train, axis=1, keepdims=True)
+                    norms[norms == 0] = 1.0
+                    self.train_embeddings[lang] = np.ascontiguousarray(train / norms)
+                    self.train_positions[lang] = np.asarray(model.embedding_, dtype=np.float32)
+
                 logger.info(f"Loaded UMAP model for {lang}")
             except Exception as e:
                 logger.error(f"Failed to load UMAP model for {lang}: {e}")
@@ -61,6 +73,9 @@ class UMAPProjector:
             raise ValueError(f"No UMAP model available for language: {language}")
 
         try:
+            if language in self.train_positions:
+                return self._project_from_neighbors(embedding, language)
+
             # UMAP expects 2D input (n_samples, n_features)
             embedding_2d = embedding.reshape(1, -1)
 
@@ -72,6 +87,31 @@ class UMAPProjector:
             logger.error(f"UMAP projection failed: {e}")
             raise
 
+    def _project_from_neighbors(self, embedding: np.ndarray, language: str) -> Tuple[float, float]:
+        """
+        Approximate .transform: similarity-weighted mean of the 2D positions
+        of the k nearest training points (k = umap_n_neighbors).
+        """
+        query = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        similarities = self.train_embeddings[language] @ query
+        positions = self.train_positions[language]
+
+        best = int(np.argmax(similarities))
+        if similarities[best] > 0.999:
+            # A training point itself: use its fitted position
+            return float(positions[best, 0]), float(positions[best, 1])
+
+        k = min(settings.umap_n_neighbors, len(similarities))
+        nearest = np.argpartition(-similarities, k - 1)[:k]
+        weights = np.clip(similarities[nearest], 0.0, None)
+        if weights.sum() == 0:
+            weights = np.ones_like(weights)
+        x, z = weights @ positions[nearest] / weights.sum()
+        return float(x), float(z)
+
     def calculate_weight(self, embedding: np.ndarray, language: str) -> float:
         """
         Calculate semantic weight from embedding magnitude.
@@ -91,21 +131,42 @@ class UMAPProjector:
         try:
             # Calculate L2 norm
             norm = float(np.linalg.norm(embedding))
+            return self._weight_from_norm(norm, language)
+        except Exception as e:
+            logger.error(f"Weight calculation failed: {e}")
+            raise
 
-            # Normalize to [0, 1] range
-            min_norm = self.min_norms[language]
-            max_norm = self.max_norms[language]
+    def _weight_from_norm(self, norm: float, language: str) -> float:
+        """Scale an L2 norm to [0, 1] with the language's norm range."""
+        min_norm = self.min_norms[language]
+        max_norm = self.max_norms[language]
 
-            if max_norm == min_norm:
-                return 0.5  # Fallback for edge case
+        if max_norm == min_norm:
+            return 0.5  # Fallback for edge case
 
-            weight = (norm - min_norm) / (max_norm - min_norm)
+        weight = (norm - min_norm) / (max_norm - min_norm)
 
-            # Clamp to [0, 1] range
-            return max(0.0, min(1.0, weight))
-        except Exception as e:
-            logger.error(f"Weight calculation failed: {e}")
-            raise
+        # Clamp to [0, 1] range
+        return max(0.0, min(1.0, weight))
+
+    def project_and_weight(self, embedding: np.ndarray, language: str) -> Tuple[float, float, float]:
+        """
+        Project embedding to 2D and calculate its weight in one call.
+
+        Args:
+            embedding: 1024-dimensional embedding vector
+            language: Language code (en, de)
+
+        Returns:
+            Tuple of (x, z, weight)
+        """
+        if language not in self.min_norms or language not in self.max_norms:
+            raise ValueError(f"Normalization stats not available for language: {language}")
+
+        x, z = self.project(embedding, language)
+        embedding = np.asarray(embedding).ravel()
+        norm = float(np.sqrt(np.dot(embedding, embedding)))
+        return x, z, self._weight_from_norm(norm, language)
 
     def is_available(self, language: str) -> bool:
         """Check if UMAP model is available for language."""
@@ -24,12 +24,15 @@ Output:
 """
 
 import argparse
-import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 
 import numpy as np
+import orjson
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -38,7 +41,8 @@ load_dotenv()
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lib.embeddings import cosine_similarity_matrix, compute_embedding_weight
+from lib.cache import CACHE_ROOT, array_from_bytes, array_to_bytes, atomic_write, cache_key, read_or_discard
+from lib.embeddings import cosine_similarity_matrix, compute_embedding_weights
 from lib.models import (
     list_models,
     get_provider,
@@ -52,11 +56,30 @@ from benchmark.metrics import run_all_metrics, MetricResults
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "benchmark_output"
 
+# Output JSON: indented for diffs; NumPy scalars/arrays serialize natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Definitions per provider.embed call, and max calls in flight per API
+# model (shared by both languages; local models run one call at a time)
+EMBED_CHUNK_SIZE = int(os.environ.get("LACUNA_BENCHMARK_EMBED_CHUNK", "256"))
+EMBED_CONCURRENCY = int(os.environ.get("LACUNA_BENCHMARK_CONCURRENCY", "8"))
+
+# On-disk cache of benchmark embeddings, one file per model + text.
+# Set LACUNA_BENCHMARK_CACHE=0 to always call the providers.
+BENCHMARK_CACHE_DIR = CACHE_ROOT / "benchmark"
+BENCHMARK_CACHE_ENABLED = os.environ.get("LACUNA_BENCHMARK_CACHE", "1") != "0"
+
+# Fit UMAP on the GPU with cuML when it is installed. Off by default:
+# cuML layouts differ from umap-learn's for the same seed.
+USE_CUML = os.environ.get("LACUNA_BENCHMARK_CUML", "0") == "1"
+
+# cuML UMAP class (lazy init). False = cuML not installed.
+_cuml_umap = None
+
 
 def load_concepts(path: Path) -> List[Dict]:
     """Load concepts from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
 
 
 def extract_data_for_benchmark(
@@ -102,17 +125,141 @@ def extract_data_for_benchmark(
     }
 
 
-def fit_umap(embeddings: np.ndarray, random_state: int = 42) -> np.ndarray:
-    """Fit UMAP and transform embeddings to 2D."""
-    import umap
+def provider_limiter(model_key: str) -> threading.BoundedSemaphore:
+    """
+    Semaphore bounding concurrent provider.embed calls for one model.
+
+    API models allow EMBED_CONCURRENCY calls in flight. Local models hold
+    one model instance that must not be called from several threads, so
+    they get one call at a time (as do models whose config doesn't say).
+    """
+    config = get_model_config(model_key)
+    is_api = getattr(config, "provider", "local") == "api"
+    return threading.BoundedSemaphore(EMBED_CONCURRENCY if is_api else 1)
+
+
+def embed_concurrent(
+    provider,
+    texts: List[str],
+    chunk_size: int = EMBED_CHUNK_SIZE,
+    limiter: Optional[threading.BoundedSemaphore] = None
+) -> np.ndarray:
+    """
+    Embed texts with provider.embed, sending chunks concurrently.
+
+    Args:
+        provider: Embedding provider from lib.models
+        texts: Texts to embed
+        chunk_size: Texts per provider.embed call
+        limiter: Bounds provider.embed calls in flight; share one across
+            callers using the same provider (default: EMBED_CONCURRENCY
+            for this call alone)
+
+    Returns:
+        (N, D) embeddings in input order
+    """
+    if limiter is None:
+        limiter = threading.BoundedSemaphore(EMBED_CONCURRENCY)
+
+    def embed_chunk(chunk: List[str]) -> np.ndarray:
+        with limiter:
+            return provider.embed(chunk)
+
+    if len(texts) <= chunk_size:
+        return embed_chunk(texts)
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(EMBED_CONCURRENCY, len(chunks))) as pool:
+        # map keeps chunk order, so rows line up with texts
+        return np.vstack(list(pool.map(embed_chunk, chunks)))
+
+
+def cached_embed(
+    provider,
+    model_key: str,
+    texts: List[str],
+    use_cache: Optional[bool] = None,
+    limiter: Optional[threading.BoundedSemaphore] = None
+) -> np.ndarray:
+    """
+    Embed texts with a provider, reusing embeddings from earlier runs.
+
+    Each distinct text is embedded once; texts already in the benchmark
+    cache for this model skip the provider entirely.
+
+    Args:
+        provider: Embedding provider from lib.models
+        model_key: Model identifier (cache namespace)
+        texts: Texts to embed
+        use_cache: Read/write the cache (default: LACUNA_BENCHMARK_CACHE)
+        limiter: Passed to embed_concurrent
+
+    Returns:
+        (N, D) embeddings in input order
+    """
+    if use_cache is None:
+        use_cache = BENCHMARK_CACHE_ENABLED
+    if not texts:
+        return embed_concurrent(provider, texts, limiter=limiter)
+
+    unique_texts = list(dict.fromkeys(texts))
+    rows: Dict[str, np.ndarray] = {}
+    cache_paths: Dict[str, Path] = {}
+
+    if use_cache:
+        model_cache_dir = BENCHMARK_CACHE_DIR / model_key
+        for text in unique_texts:
+            cache_paths[text] = model_cache_dir / f"{cache_key(model_key, text)}.npy"
+            cached = read_or_discard(cache_paths[text], array_from_bytes)
+            if cached is not None:
+                rows[text] = cached
+
+    missing = [text for text in unique_texts if text not in rows]
+    if use_cache:
+        print(f"[compare] {len(unique_texts) - len(missing)}/{len(unique_texts)} embeddings cached")
+
+    if missing:
+        embedded = np.asarray(embed_concurrent(provider, missing, limiter=limiter))
+        for text, embedding in zip(missing, embedded):
+            rows[text] = embedding
+            if use_cache:
+                atomic_write(cache_paths[text], array_to_bytes(embedding))
+
+    return np.stack([rows[text] for text in texts])
+
+
+def get_cuml_umap():
+    """Get cuML's UMAP class. Returns None if cuML is missing."""
+    global _cuml_umap
+    if _cuml_umap is None:
+        try:
+            from cuml.manifold import UMAP
+        except ImportError:
+            print("[compare] cuML not installed, fitting UMAP on CPU")
+            _cuml_umap = False
+        else:
+            _cuml_umap = UMAP
+    return _cuml_umap or None
 
-    reducer = umap.UMAP(
+
+def fit_umap(embeddings: np.ndarray, random_state: int = 42) -> np.ndarray:
+    """Fit UMAP and transform embeddings to 2D (on GPU if LACUNA_BENCHMARK_CUML=1)."""
+    params = dict(
         n_components=2,
         n_neighbors=min(15, len(embeddings) - 1),
         min_dist=0.1,
         metric="cosine",
         random_state=random_state,
     )
+
+    cuml_umap = get_cuml_umap() if USE_CUML else None
+    if cuml_umap is not None:
+        # NumPy in, NumPy out
+        return np.asarray(cuml_umap(**params).fit_transform(embeddings))
+
+    import umap
+
+    reducer = umap.UMAP(**params)
     return reducer.fit_transform(embeddings)
 
 
@@ -137,11 +284,17 @@ def build_concepts_json(
     # Build lookup from original
     original_lookup = {c["id"]: c.copy() for c in original_concepts}
 
-    # Fit UMAP for each language
+    # Fit UMAP for each language (as [x, y] lists of Python floats)
     positions_by_lang = {}
     for lang, embeddings in embeddings_by_lang.items():
         print(f"[compare] Fitting UMAP for {lang}...")
-        positions_by_lang[lang] = fit_umap(embeddings)
+        positions_by_lang[lang] = np.asarray(fit_umap(embeddings), dtype=np.float64).tolist()
+
+    # Semantic weight of every concept, one similarity matrix per language
+    weights_by_lang = {
+        lang: compute_embedding_weights(embeddings).tolist()
+        for lang, embeddings in embeddings_by_lang.items()
+    }
 
     # Build output concepts
     output_concepts = []
@@ -155,19 +308,14 @@ def build_concepts_json(
         idx = id_to_idx[cid]
 
         # Update positions
-        c["position"] = {}
-        for lang, positions in positions_by_lang.items():
-            c["position"][lang] = [
-                float(positions[idx, 0]),
-                float(positions[idx, 1])
-            ]
+        c["position"] = {
+            lang: positions[idx] for lang, positions in positions_by_lang.items()
+        }
 
         # Update weights
-        c["weight"] = {}
-        for lang, embeddings in embeddings_by_lang.items():
-            c["weight"][lang] = compute_embedding_weight(
-                embeddings[idx], embeddings
-            )
+        c["weight"] = {
+            lang: weights[idx] for lang, weights in weights_by_lang.items()
+        }
 
         # Mark source
         c["source"] = "embedding"
@@ -214,16 +362,24 @@ def run_benchmark_for_model(
     model_dir = output_dir / model_key
     model_dir.mkdir(parents=True, exist_ok=True)
 
-    # Embed each language
-    embeddings_by_lang = {}
-    for lang in ["en", "de"]:
+    # Embed both languages concurrently. Every provider.embed call goes
+    # through one limiter: several at once for API models (network-bound),
+    # strictly one at a time for local ones (a shared in-memory model)
+    languages = ["en", "de"]
+    limiter = provider_limiter(model_key)
+
+    def embed_language(lang: str) -> np.ndarray:
         definitions = data["definitions"][lang]
         print(f"[compare] Embedding {len(definitions)} {lang} definitions...")
+        # float32 from here on: saved .npy files and every metric matrix
+        embeddings = cached_embed(provider, model_key, definitions, limiter=limiter)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
-        embeddings = provider.embed(definitions)
-        embeddings_by_lang[lang] = embeddings
+    with ThreadPoolExecutor(max_workers=len(languages)) as pool:
+        embeddings_by_lang = dict(zip(languages, pool.map(embed_language, languages)))
 
-        # Save embeddings
+    # Save embeddings
+    for lang, embeddings in embeddings_by_lang.items():
         np.save(model_dir / f"embeddings_{lang}.npy", embeddings)
 
     # Build concepts JSON
@@ -235,10 +391,18 @@ def run_benchmark_for_model(
     )
 
     # Save concepts
-    with open(model_dir / "concepts.json", "w") as f:
-        json.dump(concepts, f, indent=2, ensure_ascii=False)
+    (model_dir / "concepts.json").write_bytes(orjson.dumps(concepts, option=JSON_OPTIONS))
+
+    return compute_and_save_metrics(model_key, data, embeddings_by_lang, model_dir)
 
-    # Run metrics
+
+def compute_and_save_metrics(
+    model_key: str,
+    data: Dict,
+    embeddings_by_lang: Dict[str, np.ndarray],
+    model_dir: Path
+) -> MetricResults:
+    """Run all metrics on a model's embeddings and save metrics.json."""
     results = run_all_metrics(
         embeddings_en=embeddings_by_lang["en"],
         embeddings_de=embeddings_by_lang["de"],
@@ -250,12 +414,35 @@ def run_benchmark_for_model(
     )
 
     # Save metrics
-    with open(model_dir / "metrics.json", "w") as f:
-        json.dump(results.to_dict(), f, indent=2)
+    (model_dir / "metrics.json").write_bytes(orjson.dumps(results.to_dict(), option=JSON_OPTIONS))
 
     return results
 
 
+def load_saved_embeddings(model_dir: Path, n_concepts: int) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Memory-map a model's saved embeddings_{lang}.npy files.
+
+    Returns:
+        {lang: (N, D) read-only embeddings}, or None if a file is missing,
+        unreadable, or was saved for a different concept set
+    """
+    embeddings_by_lang = {}
+    for lang in ["en", "de"]:
+        path = model_dir / f"embeddings_{lang}.npy"
+        if not path.exists():
+            return None
+        try:
+            embeddings = np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            print(f"[compare] Cannot read {path}: {e}")
+            return None
+        if embeddings.ndim != 2 or len(embeddings) != n_concepts:
+            return None
+        embeddings_by_lang[lang] = embeddings
+    return embeddings_by_lang
+
+
 def build_comparison(results: Dict[str, MetricResults]) -> dict:
     """
     Build cross-model comparison rankings.
@@ -335,7 +522,8 @@ def main():
     parser.add_argument(
         "--skip-existing",
         action="store_true",
-        help="Skip models that already have results"
+        help="Don't re-embed models that already have results "
+             "(metrics are recomputed from their saved embeddings)"
     )
     parser.add_argument(
         "--list-models",
@@ -391,17 +579,26 @@ def main():
             metrics_file = args.output_dir / model_key / "metrics.json"
             if metrics_file.exists():
                 print(f"\n[compare] Skipping {model_key} (results exist)")
-                # Load existing results
-                with open(metrics_file) as f:
-                    metrics_data = json.load(f)
-                    results = MetricResults(
-                        model_key=model_key,
-                        clas_score=metrics_data["clas"]["score"],
-                        topology_preservation=metrics_data["topology"]["preservation"],
-                        cluster_coherence_avg=metrics_data["cluster_coherence"]["average"],
-                        ghost_detection_rate=metrics_data["ghost_detection"]["rate"],
+                # Recompute metrics from the saved embeddings (no provider
+                # calls), so metrics.json keeps its per-concept detail
+                saved = load_saved_embeddings(
+                    args.output_dir / model_key, len(data["concept_ids"])
+                )
+                if saved is not None:
+                    all_results[model_key] = compute_and_save_metrics(
+                        model_key, data, saved, args.output_dir / model_key
                     )
-                    all_results[model_key] = results
+                    continue
+                # Otherwise load existing results
+                metrics_data = orjson.loads(metrics_file.read_bytes())
+                results = MetricResults(
+                    model_key=model_key,
+                    clas_score=metrics_data["clas"]["score"],
+                    topology_preservation=metrics_data["topology"]["preservation"],
+                    cluster_coherence_avg=metrics_data["cluster_coherence"]["average"],
+                    ghost_detection_rate=metrics_data["ghost_detection"]["rate"],
+                )
+                all_results[model_key] = results
                 continue
 
         results = run_benchmark_for_model(
@@ -418,8 +615,9 @@ def main():
 
         comparison = build_comparison(all_results)
 
-        with open(args.output_dir / "comparison.json", "w") as f:
-            json.dump(comparison, f, indent=2)
+        (args.output_dir / "comparison.json").write_bytes(
+            orjson.dumps(comparison, option=JSON_OPTIONS)
+        )
 
         # Print summary
         print("\n" + "="*60)
@@ -446,8 +644,7 @@ def main():
     # Save manifest
     manifest = get_manifest()
     manifest["benchmark_models"] = list(all_results.keys())
-    with open(args.output_dir / "manifest.json", "w") as f:
-        json.dump(manifest, f, indent=2)
+    (args.output_dir / "manifest.json").write_bytes(orjson.dumps(manifest, option=JSON_OPTIONS))
 
     print(f"\n[compare] Results saved to {args.output_dir}")
     print("[compare] Done!")
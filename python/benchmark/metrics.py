@@ -24,7 +24,6 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 from scipy import stats
-from scipy.spatial.distance import pdist, squareform
 
 
 @dataclass
@@ -63,10 +62,41 @@ class MetricResults:
         }
 
 
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize each row as float32 (zero rows stay zero)."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return np.divide(embeddings, norms + 1e-10)
+
+
+def _cosine_distances(similarities: np.ndarray) -> np.ndarray:
+    """
+    Cosine distance matrix from a cosine similarity matrix.
+
+    Clipped to [0, 2] with an exact zero diagonal, as
+    squareform(pdist(..., 'cosine')) would give, so it is also valid for
+    metric='precomputed'.
+    """
+    distances = np.clip(1.0 - similarities, 0.0, 2.0)
+    np.fill_diagonal(distances, 0.0)
+    return distances
+
+
+def _if_unit_rows(embeddings: np.ndarray, similarities: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Return the normalized-row similarities only if the rows were already
+    unit length, i.e. they equal the raw dot products ghost weights use.
+    """
+    norms = np.linalg.norm(embeddings, axis=1)
+    return similarities if np.allclose(norms, 1.0, atol=1e-3) else None
+
+
 def compute_clas(
     embeddings_en: np.ndarray,
     embeddings_de: np.ndarray,
-    concept_ids: List[str]
+    concept_ids: List[str],
+    en_norm: Optional[np.ndarray] = None,
+    de_norm: Optional[np.ndarray] = None
 ) -> Tuple[float, Dict[str, float]]:
     """
     Compute Cross-Lingual Alignment Score (CLAS).
@@ -78,6 +108,8 @@ def compute_clas(
         embeddings_en: (N, D) English embeddings
         embeddings_de: (N, D) German embeddings
         concept_ids: List of concept IDs (same order as embeddings)
+        en_norm: Precomputed L2-normalized embeddings_en (optional)
+        de_norm: Precomputed L2-normalized embeddings_de (optional)
 
     Returns:
         Tuple of (average CLAS, per-concept CLAS dict)
@@ -86,17 +118,17 @@ def compute_clas(
         raise ValueError("EN and DE embeddings must have same length")
 
     # Normalize embeddings
-    en_norm = embeddings_en / (np.linalg.norm(embeddings_en, axis=1, keepdims=True) + 1e-10)
-    de_norm = embeddings_de / (np.linalg.norm(embeddings_de, axis=1, keepdims=True) + 1e-10)
+    if en_norm is None:
+        en_norm = _normalize_rows(embeddings_en)
+    if de_norm is None:
+        de_norm = _normalize_rows(embeddings_de)
 
-    # Compute cosine similarity for each concept
-    per_concept = {}
-    for i, cid in enumerate(concept_ids):
-        sim = float(np.dot(en_norm[i], de_norm[i]))
-        per_concept[cid] = sim
+    # Cosine similarity for each concept: row-wise dot product in one pass
+    sims = np.einsum('ij,ij->i', en_norm, de_norm)
+    per_concept = dict(zip(concept_ids, sims.tolist()))
 
     # Average CLAS
-    avg_clas = float(np.mean(list(per_concept.values())))
+    avg_clas = float(np.mean(sims, dtype=np.float64))
 
     return avg_clas, per_concept
 
@@ -104,7 +136,9 @@ def compute_clas(
 def compute_topology_preservation(
     embeddings_en: np.ndarray,
     embeddings_de: np.ndarray,
-    n_permutations: int = 999
+    n_permutations: int = 999,
+    dist_en: Optional[np.ndarray] = None,
+    dist_de: Optional[np.ndarray] = None
 ) -> Tuple[float, float]:
     """
     Compute Topology Preservation using Mantel test.
@@ -116,13 +150,20 @@ def compute_topology_preservation(
         embeddings_en: (N, D) English embeddings
         embeddings_de: (N, D) German embeddings
         n_permutations: Number of permutations for p-value (0 for no p-value)
+        dist_en: Precomputed (N, N) cosine distances for EN (optional)
+        dist_de: Precomputed (N, N) cosine distances for DE (optional)
 
     Returns:
         Tuple of (Spearman correlation, p-value)
     """
-    # Compute distance matrices (cosine distance = 1 - cosine similarity)
-    dist_en = squareform(pdist(embeddings_en, metric='cosine'))
-    dist_de = squareform(pdist(embeddings_de, metric='cosine'))
+    # Compute distance matrices (cosine distance = 1 - cosine similarity),
+    # one float32 GEMM each on normalized rows
+    if dist_en is None:
+        en_norm = _normalize_rows(embeddings_en)
+        dist_en = _cosine_distances(en_norm @ en_norm.T)
+    if dist_de is None:
+        de_norm = _normalize_rows(embeddings_de)
+        dist_de = _cosine_distances(de_norm @ de_norm.T)
 
     # Flatten upper triangles for correlation
     n = len(embeddings_en)
@@ -135,14 +176,33 @@ def compute_topology_preservation(
 
     # Permutation test for p-value
     if n_permutations > 0:
-        perm_correlations = []
-        for _ in range(n_permutations):
-            perm = np.random.permutation(n)
-            perm_vec_de = dist_de[perm][:, perm][triu_indices]
-            perm_corr, _ = stats.spearmanr(vec_en, perm_vec_de)
-            perm_correlations.append(perm_corr)
-
-        p_value = (np.sum(np.abs(perm_correlations) >= np.abs(correlation)) + 1) / (n_permutations + 1)
+        # Permuting rows/columns of dist_de only reorders its upper-triangle
+        # values, so their ranks never change: rank once into a symmetric
+        # matrix, then per permutation just gather ranks and take the
+        # Pearson correlation on ranks (= Spearman) as a dot product
+        rank_de = np.zeros((n, n))
+        rank_de[triu_indices] = stats.rankdata(vec_de)
+        rank_de += rank_de.T
+        rank_de_vec = rank_de[triu_indices]
+        rank_de_mean = rank_de_vec.mean()
+        rank_de_norm = np.linalg.norm(rank_de_vec - rank_de_mean)
+
+        rank_en = stats.rankdata(vec_en)
+        rank_en -= rank_en.mean()
+        rank_en /= np.linalg.norm(rank_en) * rank_de_norm
+
+        observed = (rank_de_vec - rank_de_mean) @ rank_en
+
+        perms = np.array([np.random.permutation(n) for _ in range(n_permutations)])
+        rows, cols = triu_indices
+        perm_correlations = np.empty(n_permutations)
+        batch = 64  # permutations per gather; bounds the (batch, N*(N-1)/2) buffer
+        for start in range(0, n_permutations, batch):
+            p = perms[start:start + batch]
+            gathered = rank_de[p[:, rows], p[:, cols]]
+            perm_correlations[start:start + batch] = (gathered - rank_de_mean) @ rank_en
+
+        p_value = (np.sum(np.abs(perm_correlations) >= np.abs(observed)) + 1) / (n_permutations + 1)
     else:
         p_value = 0.0
 
@@ -152,7 +212,8 @@ def compute_topology_preservation(
 def compute_cluster_coherence(
     embeddings: np.ndarray,
     cluster_labels: List[str],
-    language: str = "en"
+    language: str = "en",
+    distances: Optional[np.ndarray] = None
 ) -> Tuple[Dict[str, float], float]:
     """
     Compute Cluster Coherence using Silhouette score.
@@ -164,35 +225,34 @@ def compute_cluster_coherence(
         embeddings: (N, D) embeddings
         cluster_labels: Cluster label for each concept
         language: Language identifier for reporting
+        distances: Precomputed (N, N) cosine distances (optional)
 
     Returns:
         Tuple of (per-cluster scores, average score)
     """
-    from sklearn.metrics import silhouette_samples, silhouette_score
+    from sklearn.metrics import silhouette_samples
 
-    # Get unique clusters
-    unique_clusters = list(set(cluster_labels))
+    # Unique clusters (sorted) and each concept's index into them
+    unique_clusters, numeric_labels = np.unique(cluster_labels, return_inverse=True)
     if len(unique_clusters) < 2:
         return {}, 0.0
 
-    # Convert labels to numeric
-    label_to_idx = {label: i for i, label in enumerate(unique_clusters)}
-    numeric_labels = np.array([label_to_idx[l] for l in cluster_labels])
-
-    # Compute per-sample silhouette
+    # Compute per-sample silhouette from one cosine distance matrix; the
+    # overall score is just their mean (what silhouette_score returns)
+    if distances is None:
+        emb_norm = _normalize_rows(embeddings)
+        distances = _cosine_distances(emb_norm @ emb_norm.T)
     try:
-        sample_scores = silhouette_samples(embeddings, numeric_labels, metric='cosine')
-        avg_score = float(silhouette_score(embeddings, numeric_labels, metric='cosine'))
+        sample_scores = silhouette_samples(distances, numeric_labels, metric='precomputed')
+        avg_score = float(np.mean(sample_scores))
     except ValueError:
         # Not enough samples per cluster
         return {}, 0.0
 
-    # Aggregate per cluster
-    per_cluster = {}
-    for cluster in unique_clusters:
-        mask = np.array([l == cluster for l in cluster_labels])
-        if np.sum(mask) > 0:
-            per_cluster[cluster] = float(np.mean(sample_scores[mask]))
+    # Aggregate per cluster (every unique cluster has at least one member)
+    sums = np.bincount(numeric_labels, weights=sample_scores)
+    counts = np.bincount(numeric_labels)
+    per_cluster = dict(zip(unique_clusters.tolist(), (sums / counts).tolist()))
 
     return per_cluster, avg_score
 
@@ -201,7 +261,8 @@ def compute_ghost_detection_rate(
     embeddings: np.ndarray,
     concept_ids: List[str],
     ghost_flags: Dict[str, bool],
-    weight_threshold: float = 0.3
+    weight_threshold: float = 0.3,
+    similarities: Optional[np.ndarray] = None
 ) -> Tuple[float, Dict[str, float]]:
     """
     Compute Ghost Detection Rate.
@@ -214,17 +275,16 @@ def compute_ghost_detection_rate(
         concept_ids: List of concept IDs
         ghost_flags: Dict mapping concept_id -> is_ghost for this language
         weight_threshold: Weight below which we consider ghost "detected"
+        similarities: Precomputed embeddings @ embeddings.T (optional)
 
     Returns:
         Tuple of (detection rate, per-ghost scores)
     """
-    # Compute semantic weights
-    from lib.embeddings import compute_embedding_weight
+    # Compute semantic weights (all rows in one pass)
+    from lib.embeddings import compute_embedding_weights
 
-    weights = {}
-    for i, cid in enumerate(concept_ids):
-        weight = compute_embedding_weight(embeddings[i], embeddings)
-        weights[cid] = weight
+    weights = compute_embedding_weights(embeddings, similarities=similarities)
+    row_of = {cid: i for i, cid in enumerate(concept_ids)}
 
     # Check ghosts
     ghost_scores = {}
@@ -232,9 +292,9 @@ def compute_ghost_detection_rate(
     total_ghosts = 0
 
     for cid, is_ghost in ghost_flags.items():
-        if is_ghost and cid in weights:
+        if is_ghost and cid in row_of:
             total_ghosts += 1
-            weight = weights[cid]
+            weight = float(weights[row_of[cid]])
             ghost_scores[cid] = weight
             if weight < weight_threshold:
                 detected += 1
@@ -270,20 +330,37 @@ def run_all_metrics(
     """
     results = MetricResults(model_key=model_key)
 
+    # Similarities are well within float32 precision; keep every derived
+    # matrix float32 too (half the memory traffic of float64)
+    embeddings_en = np.ascontiguousarray(embeddings_en, dtype=np.float32)
+    embeddings_de = np.ascontiguousarray(embeddings_de, dtype=np.float32)
+
+    # Normalize once and share one similarity matrix per language
+    en_norm = _normalize_rows(embeddings_en)
+    de_norm = _normalize_rows(embeddings_de)
+    sim_en = en_norm @ en_norm.T
+    sim_de = de_norm @ de_norm.T
+    dist_en = _cosine_distances(sim_en)
+    dist_de = _cosine_distances(sim_de)
+
     print(f"[metrics] Computing CLAS...")
     results.clas_score, results.clas_per_concept = compute_clas(
-        embeddings_en, embeddings_de, concept_ids
+        embeddings_en, embeddings_de, concept_ids, en_norm=en_norm, de_norm=de_norm
     )
 
     print(f"[metrics] Computing Topology Preservation...")
     results.topology_preservation, results.topology_p_value = compute_topology_preservation(
-        embeddings_en, embeddings_de, n_permutations=999
+        embeddings_en, embeddings_de, n_permutations=999, dist_en=dist_en, dist_de=dist_de
     )
 
     print(f"[metrics] Computing Cluster Coherence...")
     # Compute for both languages
-    coherence_en, avg_en = compute_cluster_coherence(embeddings_en, cluster_labels, "en")
-    coherence_de, avg_de = compute_cluster_coherence(embeddings_de, cluster_labels, "de")
+    coherence_en, avg_en = compute_cluster_coherence(
+        embeddings_en, cluster_labels, "en", distances=dist_en
+    )
+    coherence_de, avg_de = compute_cluster_coherence(
+        embeddings_de, cluster_labels, "de", distances=dist_de
+    )
 
     results.cluster_coherence = {
         "en": coherence_en,
@@ -294,10 +371,12 @@ def run_all_metrics(
     print(f"[metrics] Computing Ghost Detection Rate...")
     # Compute for both languages
     rate_en, scores_en = compute_ghost_detection_rate(
-        embeddings_en, concept_ids, ghost_flags_en
+        embeddings_en, concept_ids, ghost_flags_en,
+        similarities=_if_unit_rows(embeddings_en, sim_en)
     )
     rate_de, scores_de = compute_ghost_detection_rate(
-        embeddings_de, concept_ids, ghost_flags_de
+        embeddings_de, concept_ids, ghost_flags_de,
+        similarities=_if_unit_rows(embeddings_de, sim_de)
     )
 
     results.ghost_detection_rate = (rate_en + rate_de) / 2
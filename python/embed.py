@@ -19,12 +19,12 @@ Prerequisites:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
 import numpy as np
+import orjson
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -39,8 +39,7 @@ from lib.embeddings import (
 
 def load_concepts(path: Path) -> List[Dict]:
     """Load concepts from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
 
 
 def extract_definitions_by_language(
@@ -53,15 +52,17 @@ def extract_definitions_by_language(
     Returns:
         {lang: (ids, definitions)} for each language
     """
-    result = {}
-    for lang in languages:
-        ids = []
-        definitions = []
-        for c in concepts:
-            if "definitions" in c and lang in c["definitions"]:
+    result = {lang: ([], []) for lang in languages}
+    # Single pass over concepts; only touch the languages each concept has
+    for c in concepts:
+        defs = c.get("definitions")
+        if not defs:
+            continue
+        for lang, defn in defs.items():
+            if lang in result:
+                ids, definitions = result[lang]
                 ids.append(c["id"])
-                definitions.append(c["definitions"][lang])
-        result[lang] = (ids, definitions)
+                definitions.append(defn)
     return result
 
 
@@ -93,18 +94,19 @@ def print_distance_matrix(
     top_n: int = 5
 ):
     """Print top-N neighbors for each concept."""
-    print("\n" + "=" * 60)
-    print("DISTANCE MATRIX (Top neighbors by cosine similarity)")
-    print("=" * 60)
+    # Collect lines and write once instead of one print() per row
+    lines = ["", "=" * 60, "DISTANCE MATRIX (Top neighbors by cosine similarity)", "=" * 60]
 
     for i, id_ in enumerate(ids):
         # Get similarities, exclude self
         sims = [(j, sim_matrix[i, j]) for j in range(len(ids)) if j != i]
         sims.sort(key=lambda x: x[1], reverse=True)
 
-        print(f"\n{id_}:")
+        lines.append(f"\n{id_}:")
         for j, sim in sims[:top_n]:
-            print(f"  {ids[j]:25s} {sim:.3f}")
+            lines.append(f"  {ids[j]:25s} {sim:.3f}")
+
+    print("\n".join(lines))
 
 
 def detect_issues(
@@ -114,10 +116,6 @@ def detect_issues(
     uniform_threshold: float = 0.7,
 ):
     """Detect and report potential issues."""
-    print("\n" + "=" * 60)
-    print("VALIDATION ISSUES")
-    print("=" * 60)
-
     issues = []
 
     # Check for duplicates
@@ -142,11 +140,12 @@ def detect_issues(
         if sims and max(sims) < 0.4:
             issues.append(f"OUTLIER: {id_} (max_sim={max(sims):.3f}) - may not belong in this concept space")
 
+    lines = ["", "=" * 60, "VALIDATION ISSUES", "=" * 60]
     if issues:
-        for issue in issues:
-            print(f"  - {issue}")
+        lines.extend(f"  - {issue}" for issue in issues)
     else:
-        print("  No issues detected.")
+        lines.append("  No issues detected.")
+    print("\n".join(lines))
 
     return issues
 
@@ -277,8 +276,7 @@ def main():
     # Write output
     output_path = args.output or args.input
     print(f"[embed] Writing to {output_path}")
-    with open(output_path, "w") as f:
-        json.dump(updated_concepts, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(orjson.dumps(updated_concepts, option=orjson.OPT_INDENT_2))
 
     print("[embed] Done!")
 
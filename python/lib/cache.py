@@ -0,0 +1,125 @@
+"""
+On-disk cache entries shared by the extractor, interpreter, embedding
+and benchmark caches.
+
+Each entry is one file named by a hash of everything that determines it.
+Writes go to a temp file that is renamed into place, so a crash never
+leaves a half-written entry; an entry that fails to load is deleted and
+treated as a miss.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# Root for every cache (each module uses its own subdirectory)
+CACHE_ROOT = Path(os.environ.get("LACUNA_CACHE_DIR", Path.home() / ".cache" / "lacuna"))
+
+
+def cache_key(*parts: str) -> str:
+    """Hex cache key for a sequence of strings (NUL-separated, blake2b)."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def atomic_write(path: Path, data: bytes) -> bool:
+    """
+    Write a cache entry atomically (temp file + rename).
+
+    Failures are logged, not raised: a cache that can't be written only
+    costs a recomputation next time.
+
+    Returns:
+        True if the entry was written
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"[cache] Failed to write {path.name}: {e}")
+        return False
+    return True
+
+
+def read_or_discard(path: Path, load: Callable[[bytes], T]) -> Optional[T]:
+    """
+    Read a cache entry and decode it with load.
+
+    Args:
+        path: Entry file
+        load: Turns the file's bytes into the cached value; raises
+            ValueError (or OSError) if they are not a valid entry
+
+    Returns:
+        The loaded value, or None on a miss. Entries that can't be read
+        or loaded are deleted so they are recomputed.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"[cache] Discarding unreadable entry {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    try:
+        return load(data)
+    except (OSError, ValueError) as e:
+        # UnicodeDecodeError and JSONDecodeError are ValueErrors too
+        print(f"[cache] Discarding bad entry {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def prune(directory: Path, max_entries: int, pattern: str = "*") -> int:
+    """
+    Delete the least recently written entries beyond max_entries.
+
+    Returns:
+        Number of entries removed
+    """
+    try:
+        entries = [(p.stat().st_mtime, p) for p in directory.glob(pattern)]
+    except OSError:
+        return 0
+    excess = len(entries) - max_entries
+    if excess <= 0:
+        return 0
+    entries.sort()
+    removed = 0
+    for _, path in entries[:excess]:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def array_to_bytes(array: np.ndarray) -> bytes:
+    """Serialize an array as .npy bytes (for atomic_write)."""
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def array_from_bytes(data: bytes) -> np.ndarray:
+    """Load .npy bytes (a read_or_discard loader)."""
+    return np.load(io.BytesIO(data))
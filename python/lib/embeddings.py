@@ -3,19 +3,57 @@ LACUNA BGE-M3 embedding wrapper.
 
 Provides:
 - Lazy model loading (2GB+ model)
-- Batch embedding
+- Batch embedding (with an on-disk cache keyed by text)
+- Async embedding that merges concurrent requests into one model call
 - Cosine similarity matrix computation
 - Duplicate detection
+- Cross-language alignment (one row per concept, one matrix per language)
+
+embed_texts returns L2-normalized rows, so cosine similarity between its
+outputs is a plain dot product; pass normalized=True to the helpers below
+to skip their own normalization.
 """
 
+import asyncio
+import os
+import threading
+
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from functools import lru_cache
 
+from lib.cache import (
+    CACHE_ROOT, array_from_bytes, array_to_bytes, atomic_write, cache_key, prune, read_or_discard,
+)
+
 
 # Global model instance (lazy loaded)
 _model = None
 
+# One encode at a time: requests running in worker threads queue here
+# instead of competing for GPU memory
+_encode_lock = threading.Lock()
+
+MODEL_NAME = "BAAI/bge-m3"
+
+# On-disk cache of embeddings, keyed by model + text.
+# Set LACUNA_EMBEDDING_CACHE=0 to always run the model.
+EMBEDDING_CACHE_DIR = CACHE_ROOT / "embeddings"
+EMBEDDING_CACHE_ENABLED = os.environ.get("LACUNA_EMBEDDING_CACHE", "1") != "0"
+# Entries kept on disk (~4 KB each); the oldest beyond this are pruned
+# once per process, on the first write
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.environ.get("LACUNA_EMBEDDING_CACHE_MAX", "50000"))
+_cache_pruned = False
+
+# Recently used embeddings kept in memory (oldest evicted first)
+MEMORY_CACHE_SIZE = 4096
+_memory_cache: Dict[str, np.ndarray] = {}
+
+# embed_texts_async: how long to wait for other requests to join a batch,
+# and how many texts to collect before running it
+COALESCE_WINDOW_MS = float(os.environ.get("LACUNA_EMBED_COALESCE_MS", "20"))
+COALESCE_MAX_BATCH = 64
+
 
 def get_model():
     """Lazy load BGE-M3 model via sentence-transformers."""
@@ -23,26 +61,111 @@ def get_model():
     if _model is None:
         print("[embeddings] Loading BGE-M3 model (this takes ~30s first time)...")
         from sentence_transformers import SentenceTransformer
-        _model = SentenceTransformer("BAAI/bge-m3")
+        _model = SentenceTransformer(MODEL_NAME)
         print("[embeddings] Model loaded.")
     return _model
 
 
-def embed_texts(texts: List[str], batch_size: int = 8) -> np.ndarray:
+def warmup_model():
+    """Load the model and run one small batch so the first real request is warm."""
+    model = get_model()
+    with _encode_lock:
+        model.encode(["warmup"] * 4, batch_size=4, normalize_embeddings=True)
+
+
+def _encode(texts: List[str], batch_size: int) -> np.ndarray:
+    """Run BGE-M3 on texts (no cache)."""
+    model = get_model()
+    # sentence-transformers returns numpy array directly
+    with _encode_lock:
+        embeddings = model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def _cache_key(text: str) -> str:
+    """Cache key for a text under the current model."""
+    return cache_key(MODEL_NAME, text)
+
+
+def _remember(key: str, embedding: np.ndarray):
+    """Keep an embedding in the in-memory cache."""
+    if key not in _memory_cache and len(_memory_cache) >= MEMORY_CACHE_SIZE:
+        _memory_cache.pop(next(iter(_memory_cache)))
+    _memory_cache[key] = embedding
+
+
+def _load_cached(key: str) -> Optional[np.ndarray]:
+    """Cached embedding for a key, or None on a miss."""
+    if key in _memory_cache:
+        return _memory_cache[key]
+    embedding = read_or_discard(EMBEDDING_CACHE_DIR / f"{key}.npy", array_from_bytes)
+    if embedding is not None:
+        _remember(key, embedding)
+    return embedding
+
+
+def _store_cached(key: str, embedding: np.ndarray):
+    """Store an embedding in memory and on disk."""
+    global _cache_pruned
+    _remember(key, embedding)
+    atomic_write(EMBEDDING_CACHE_DIR / f"{key}.npy", array_to_bytes(embedding))
+    if not _cache_pruned:
+        _cache_pruned = True
+        removed = prune(EMBEDDING_CACHE_DIR, EMBEDDING_CACHE_MAX_ENTRIES, "*.npy")
+        if removed:
+            print(f"[embeddings] Pruned {removed} old cache entries")
+
+
+def embed_texts(
+    texts: List[str],
+    batch_size: int = 8,
+    use_cache: Optional[bool] = None,
+) -> np.ndarray:
     """
     Embed a list of texts using BGE-M3.
 
+    Each distinct text is encoded once per call. Texts embedded before
+    (by any run) are read from the embedding cache; only the rest go
+    through the model.
+
     Args:
         texts: List of strings to embed
         batch_size: Batch size for encoding
+        use_cache: Read/write the embedding cache (default: LACUNA_EMBEDDING_CACHE)
 
     Returns:
-        np.ndarray of shape (len(texts), 1024)
+        np.ndarray of shape (len(texts), 1024), float32, unit-length rows
     """
-    model = get_model()
-    # sentence-transformers returns numpy array directly
-    embeddings = model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
-    return np.array(embeddings)
+    if use_cache is None:
+        use_cache = EMBEDDING_CACHE_ENABLED
+    if not texts:
+        return _encode(texts, batch_size)
+
+    if not use_cache:
+        row_of = {text: row for row, text in enumerate(dict.fromkeys(texts))}
+        encoded = _encode(list(row_of), batch_size)
+        if len(row_of) == len(texts):
+            return encoded
+        return encoded[[row_of[text] for text in texts]]
+
+    keys = [_cache_key(t) for t in texts]
+    embeddings: List[Optional[np.ndarray]] = [_load_cached(k) for k in keys]
+
+    # Positions of each missing text, so repeats are encoded once
+    missing: Dict[str, List[int]] = {}
+    for i, embedding in enumerate(embeddings):
+        if embedding is None:
+            missing.setdefault(keys[i], []).append(i)
+
+    if missing:
+        encoded = _encode([texts[positions[0]] for positions in missing.values()], batch_size)
+        for (key, positions), embedding in zip(missing.items(), encoded):
+            embedding = embedding.copy()
+            _store_cached(key, embedding)
+            for i in positions:
+                embeddings[i] = embedding
+
+    return np.stack(embeddings)
 
 
 def embed_single(text: str) -> np.ndarray:
@@ -50,16 +173,111 @@ def embed_single(text: str) -> np.ndarray:
     return embed_texts([text])[0]
 
 
-def cosine_similarity_matrix(embeddings: np.ndarray) -> np.ndarray:
+class BatchCoalescer:
+    """
+    Merge concurrent embedding requests into one model call.
+
+    Callers await embed(texts); a background task collects the requests
+    that arrive within `window` seconds (or until `max_batch` texts),
+    runs embed_fn once on all of them in a worker thread, and hands each
+    caller its own rows back.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], np.ndarray],
+        window: float = COALESCE_WINDOW_MS / 1000,
+        max_batch: int = COALESCE_MAX_BATCH,
+    ):
+        self.embed_fn = embed_fn
+        self.window = window
+        self.max_batch = max_batch
+        # Queue and worker belong to one event loop; recreated on a new one
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop = None
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, sharing a model call with concurrent callers."""
+        if not texts:
+            return await asyncio.to_thread(self.embed_fn, texts)
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or loop is not self._loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+            self._loop = loop
+        future = loop.create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self._queue.get()]
+            size = len(jobs[0][0])
+            deadline = loop.time() + self.window
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                jobs.append(job)
+                size += len(job[0])
+
+            all_texts = [text for texts, _ in jobs for text in texts]
+            try:
+                embeddings = await asyncio.to_thread(self.embed_fn, all_texts)
+            except Exception:
+                # Run each request on its own so one bad input only fails its caller
+                for texts, future in jobs:
+                    try:
+                        result = await asyncio.to_thread(self.embed_fn, texts)
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                continue
+
+            start = 0
+            for texts, future in jobs:
+                stop = start + len(texts)
+                if not future.done():
+                    future.set_result(embeddings[start:stop])
+                start = stop
+
+
+_coalescer = BatchCoalescer(lambda texts: embed_texts(texts))
+
+
+async def embed_texts_async(texts: List[str]) -> np.ndarray:
+    """
+    Async embed_texts for request handlers.
+
+    Runs the model off the event loop, and requests arriving within a few
+    milliseconds of each other share one forward pass.
+    """
+    return await _coalescer.embed(texts)
+
+
+def cosine_similarity_matrix(embeddings: np.ndarray, normalized: bool = False) -> np.ndarray:
     """
     Compute pairwise cosine similarity matrix.
 
     Args:
         embeddings: (N, D) array of embeddings
+        normalized: Rows are already unit length (e.g. from embed_texts)
 
     Returns:
         (N, N) similarity matrix where [i,j] is cosine sim between i and j
     """
+    if normalized:
+        return embeddings @ embeddings.T
+
     # Normalize
     norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
     normalized = embeddings / (norms + 1e-10)
@@ -67,9 +285,67 @@ def cosine_similarity_matrix(embeddings: np.ndarray) -> np.ndarray:
     return normalized @ normalized.T
 
 
+def stack_by_language(
+    embeddings_by_lang: Dict[str, Tuple[List[str], np.ndarray]],
+) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+    """
+    Align per-language embeddings into one array, one row per concept.
+
+    Args:
+        embeddings_by_lang: {lang: (ids, (n_lang, D) embeddings)}
+
+    Returns:
+        (ids, langs, normalized, present): ids in first-seen order,
+        normalized an (L, N, D) array of L2-normalized rows (zero where a
+        language lacks the concept), present an (N, L) boolean mask
+    """
+    index: Dict[str, int] = {}
+    for ids, _ in embeddings_by_lang.values():
+        for id_ in ids:
+            index.setdefault(id_, len(index))
+    langs = list(embeddings_by_lang)
+    dim = max((e.shape[1] for _, e in embeddings_by_lang.values()), default=0)
+
+    normalized = np.zeros((len(langs), len(index), dim))
+    present = np.zeros((len(index), len(langs)), dtype=bool)
+    for l, (ids, embeddings) in enumerate(embeddings_by_lang.values()):
+        rows = np.array([index[id_] for id_ in ids], dtype=int)
+        normalized[l, rows] = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10)
+        present[rows, l] = True
+    return list(index), langs, normalized, present
+
+
+def mean_pairwise_language_similarity(
+    normalized: np.ndarray,
+    present: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean cosine similarity of each concept across its language pairs.
+
+    Args:
+        normalized: (L, N, D) output of stack_by_language
+        present: (N, L) mask from stack_by_language
+
+    Returns:
+        (similarity, pair_count), both (N,); similarity is 0 where
+        pair_count is 0 (concept in fewer than two languages)
+    """
+    n_langs, n = present.shape[1], present.shape[0]
+    sim_sum = np.zeros(n)
+    pair_count = np.zeros(n)
+    for i in range(n_langs):
+        for j in range(i + 1, n_langs):
+            both = present[:, i] & present[:, j]
+            sim_sum += np.where(both, np.einsum("ij,ij->i", normalized[i], normalized[j]), 0.0)
+            pair_count += both
+    similarity = np.divide(sim_sum, pair_count, out=np.zeros(n), where=pair_count > 0)
+    return similarity, pair_count
+
+
 def find_duplicates(
     embeddings: np.ndarray,
-    threshold: float = 0.85
+    threshold: float = 0.85,
+    normalized: bool = False,
 ) -> List[Tuple[int, int, float]]:
     """
     Find duplicate pairs based on cosine similarity threshold.
@@ -77,34 +353,38 @@ def find_duplicates(
     Args:
         embeddings: (N, D) array
         threshold: Similarity threshold for duplicates
+        normalized: Rows are already unit length
 
     Returns:
         List of (i, j, similarity) tuples where similarity > threshold
     """
-    sim_matrix = cosine_similarity_matrix(embeddings)
-    duplicates = []
-    n = len(embeddings)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if sim_matrix[i, j] > threshold:
-                duplicates.append((i, j, float(sim_matrix[i, j])))
-    return duplicates
+    sim_matrix = cosine_similarity_matrix(embeddings, normalized)
+    # Upper triangle above threshold, in row-major (i, j) order
+    rows, cols = np.nonzero(np.triu(sim_matrix > threshold, k=1))
+    return [
+        (int(i), int(j), float(sim_matrix[i, j]))
+        for i, j in zip(rows, cols)
+    ]
 
 
-def compute_uniformity_score(embeddings: np.ndarray) -> float:
+def compute_uniformity_score(embeddings: np.ndarray, normalized: bool = False) -> float:
     """
     Compute uniformity score - how spread out embeddings are.
 
     Low uniformity = embeddings too similar (boring/generic definitions)
     High uniformity = good semantic diversity
 
+    Args:
+        embeddings: (N, D) array
+        normalized: Rows are already unit length
+
     Returns:
         Score from 0 (all identical) to 1 (well spread)
     """
     if len(embeddings) < 2:
         return 1.0
 
-    sim_matrix = cosine_similarity_matrix(embeddings)
+    sim_matrix = cosine_similarity_matrix(embeddings, normalized)
     # Get upper triangle (exclude diagonal)
     n = len(embeddings)
     upper_tri = []
@@ -125,40 +405,65 @@ def compute_uniformity_score(embeddings: np.ndarray) -> float:
     return float(np.clip(uniformity, 0, 1))
 
 
-def compute_extremity_score(
-    embedding: np.ndarray,
-    reference_embeddings: np.ndarray
-) -> float:
+def compute_extremity_scores(
+    embeddings: np.ndarray,
+    reference_embeddings: np.ndarray,
+    normalized: bool = False,
+) -> np.ndarray:
     """
-    Check if an embedding is an extreme outlier from reference set.
+    Check a batch of embeddings for extreme outliers from a reference set.
+
+    One (N, M) similarity matmul instead of one call per embedding.
 
     Args:
-        embedding: Single (D,) embedding to check
-        reference_embeddings: (N, D) reference embeddings
+        embeddings: (N, D) embeddings to check
+        reference_embeddings: (M, D) reference embeddings
+        normalized: Both are already unit length
 
     Returns:
-        Score 0-1 where 0 = extreme outlier, 1 = fits well
+        (N,) scores 0-1 where 0 = extreme outlier, 1 = fits well
     """
+    embeddings = np.atleast_2d(embeddings)
     if len(reference_embeddings) == 0:
-        return 1.0
+        return np.ones(len(embeddings))
 
     # Compute cosine similarity to all reference embeddings
-    embedding = embedding.reshape(1, -1)
-    ref_norms = np.linalg.norm(reference_embeddings, axis=1, keepdims=True)
-    emb_norm = np.linalg.norm(embedding)
-
-    ref_normalized = reference_embeddings / (ref_norms + 1e-10)
-    emb_normalized = embedding / (emb_norm + 1e-10)
+    if not normalized:
+        reference_embeddings = reference_embeddings / (
+            np.linalg.norm(reference_embeddings, axis=1, keepdims=True) + 1e-10
+        )
+        embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10)
 
-    similarities = (ref_normalized @ emb_normalized.T).flatten()
+    similarities = embeddings @ reference_embeddings.T
 
     # If max similarity is very low, it's an outlier
-    max_sim = float(np.max(similarities))
-    mean_sim = float(np.mean(similarities))
+    max_sim = similarities.max(axis=1)
+    mean_sim = similarities.mean(axis=1)
 
     # Return score based on how well it fits
     # Very low max_sim = outlier
-    return float(np.clip(max_sim * 0.7 + mean_sim * 0.3, 0, 1))
+    return np.clip(max_sim * 0.7 + mean_sim * 0.3, 0, 1)
+
+
+def compute_extremity_score(
+    embedding: np.ndarray,
+    reference_embeddings: np.ndarray,
+    normalized: bool = False,
+) -> float:
+    """
+    Check if an embedding is an extreme outlier from reference set.
+
+    Args:
+        embedding: Single (D,) embedding to check
+        reference_embeddings: (N, D) reference embeddings
+        normalized: Both are already unit length
+
+    Returns:
+        Score 0-1 where 0 = extreme outlier, 1 = fits well
+    """
+    return float(compute_extremity_scores(
+        embedding.reshape(1, -1), reference_embeddings, normalized
+    )[0])
 
 
 def compute_embedding_weight(
@@ -209,3 +514,39 @@ def compute_embedding_weight(
 
     weight = (centrality - min_c) / (max_c - min_c)
     return float(np.clip(weight, 0.05, 0.95))
+
+
+def compute_embedding_weights(
+    all_embeddings: np.ndarray,
+    similarities: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Compute compute_embedding_weight for every row at once.
+
+    One (N, N) similarity matrix instead of N per-row calls that each
+    rebuild every centrality.
+
+    Args:
+        all_embeddings: All embeddings in the set (already L2-normalized)
+        similarities: Precomputed all_embeddings @ all_embeddings.T (optional)
+
+    Returns:
+        (N,) weights 0-1, row i equal to
+        compute_embedding_weight(all_embeddings[i], all_embeddings)
+    """
+    n = len(all_embeddings)
+    if n < 2:
+        return np.full(n, 0.5)
+
+    # Mean similarity to all others, dropping each row's highest (self)
+    sims = all_embeddings @ all_embeddings.T if similarities is None else similarities
+    centralities = (sims.sum(axis=1, dtype=np.float64) - sims.max(axis=1)) / (n - 1)
+
+    min_c = centralities.min()
+    max_c = centralities.max()
+
+    if max_c - min_c < 1e-6:
+        return np.full(n, 0.5)
+
+    weights = (centralities - min_c) / (max_c - min_c)
+    return np.clip(weights, 0.05, 0.95)
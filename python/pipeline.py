@@ -18,6 +18,7 @@ import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 import numpy as np
+import orjson
 
 # Load .env file
 from dotenv import load_dotenv
@@ -26,7 +27,12 @@ load_dotenv(Path(__file__).parent / ".env")
 sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.schemas import ExtractedFrame, ValidatedFrame, Concept, ExtractionResponse
-from lib.embeddings import embed_texts, compute_embedding_weight
+from lib.embeddings import (
+    embed_texts,
+    compute_embedding_weight,
+    stack_by_language,
+    mean_pairwise_language_similarity,
+)
 from agents.extractor import extract_frames
 from agents.validator import validate_frames, validate_against_existing
 
@@ -141,30 +147,27 @@ def compute_cross_language_divergence(
     Returns:
         {concept_id: divergence_score} where 0 = identical, 1 = maximally different
     """
-    divergences = {}
-
-    for frame in validated_frames:
-        lang_embeddings = []
-        for lang in languages:
-            if lang in frame.embeddings:
-                lang_embeddings.append(np.array(frame.embeddings[lang]))
-
-        if len(lang_embeddings) < 2:
-            divergences[frame.id] = 0.0
-            continue
-
-        # Cosine similarity between the same concept in different languages
-        # Low similarity = high divergence = interesting lacuna
-        sims = []
-        for i in range(len(lang_embeddings)):
-            for j in range(i + 1, len(lang_embeddings)):
-                cos_sim = float(np.dot(lang_embeddings[i], lang_embeddings[j]) /
-                    (np.linalg.norm(lang_embeddings[i]) * np.linalg.norm(lang_embeddings[j]) + 1e-10))
-                sims.append(cos_sim)
-
-        mean_sim = np.mean(sims)
-        # Convert similarity to divergence (0 = identical, 1 = opposite)
-        divergences[frame.id] = float(1.0 - mean_sim)
+    embeddings_by_lang = {}
+    for lang in languages:
+        with_lang = [f for f in validated_frames if lang in f.embeddings]
+        if with_lang:
+            embeddings_by_lang[lang] = (
+                [f.id for f in with_lang],
+                np.array([f.embeddings[lang] for f in with_lang]),
+            )
+
+    # Cosine similarity between the same concept in different languages
+    # Low similarity = high divergence = interesting lacuna
+    ids, _, normalized, present = stack_by_language(embeddings_by_lang)
+    similarity, pair_count = mean_pairwise_language_similarity(normalized, present)
+
+    # Convert similarity to divergence (0 = identical, 1 = opposite);
+    # concepts in fewer than two languages get 0
+    divergence_by_id = {
+        id_: float(1.0 - sim) if count > 0 else 0.0
+        for id_, sim, count in zip(ids, similarity, pair_count)
+    }
+    divergences = {f.id: divergence_by_id.get(f.id, 0.0) for f in validated_frames}
 
     return divergences
 
@@ -174,6 +177,7 @@ def determine_ghost_status(
     languages: List[str] = ["en", "de"],
     weight_threshold: float = 0.15,
     weight_ratio_threshold: float = 2.5,
+    weights: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> Dict[str, Dict[str, bool]]:
     """
     Determine ghost status using two signals:
@@ -184,10 +188,14 @@ def determine_ghost_status(
        in one language than the other, it's a ghost in the weaker language.
        This catches concepts that are important in DE but marginal in EN.
 
+    Pass weights from compute_weights if already computed, to avoid
+    redoing the centrality pass.
+
     Returns:
         {concept_id: {lang: is_ghost}}
     """
-    weights = compute_weights(validated_frames, languages)
+    if weights is None:
+        weights = compute_weights(validated_frames, languages)
     ghost_status = {}
 
     for frame in validated_frames:
@@ -228,7 +236,7 @@ def validated_to_concepts(
     # Compute all derived fields
     positions = fit_umap_for_concepts(validated_frames, languages)
     weights = compute_weights(validated_frames, languages)
-    ghost_status = determine_ghost_status(validated_frames, languages)
+    ghost_status = determine_ghost_status(validated_frames, languages, weights=weights)
 
     concepts = []
     for frame in validated_frames:
@@ -301,9 +309,9 @@ async def run_pipeline(
     # Step 2: Validate frames
     print("[pipeline] Step 2: Validating frames...")
     if reference_path:
-        result = validate_against_existing(frames, reference_path, languages)
+        result = await validate_against_existing(frames, reference_path, languages)
     else:
-        result = validate_frames(frames, languages=languages)
+        result = await validate_frames(frames, languages=languages)
 
     stats["validated"] = len(result.valid)
     stats["rejected"] = len(result.rejected)
@@ -319,7 +327,7 @@ async def run_pipeline(
 
     # Step 3: Convert to full concepts with positions
     print("[pipeline] Step 3: Computing positions and weights...")
-    concepts = validated_to_concepts(result.valid, languages)
+    concepts = await asyncio.to_thread(validated_to_concepts, result.valid, languages)
     print(f"[pipeline] Generated {len(concepts)} concepts")
 
     return ExtractionResponse(
@@ -383,8 +391,7 @@ def main():
     # Write output
     output_path = args.output or args.append_to
     if output_path:
-        with open(output_path, "w") as f:
-            json.dump(concepts_data, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(orjson.dumps(concepts_data, option=orjson.OPT_INDENT_2))
         print(f"[pipeline] Written {len(concepts_data)} concepts to {output_path}")
     else:
         print(json.dumps(concepts_data, indent=2, ensure_ascii=False))
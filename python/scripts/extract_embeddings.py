@@ -58,7 +58,7 @@ def main():
         print(f"  Embedding {len(texts)} concepts...")
 
         # Generate embeddings in batch
-        embeddings = embedding_service.embed_batch(texts)
+        embeddings = embedding_service.embed_batch(texts, show_progress=True)
 
         # Save embeddings
         embeddings_path = data_dir / f"embeddings_{lang}.npy"
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Check embedding plumbing that doesn't need the BGE-M3 model.
+
+Stubs the encoder and checks that embed_texts encodes each distinct text
+once and replays the on-disk cache in input order, and that
+BatchCoalescer merges concurrent requests and hands each caller its own
+rows, isolates failures, and survives a new event loop.
+
+Usage:
+    cd python && source .venv/bin/activate
+    python tests/test_embeddings.py
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import embeddings
+
+
+def fake_vectors(texts):
+    """One row per text whose first value identifies the text."""
+    return np.array([[float(text.split("-")[-1]), 1.0] for text in texts], dtype=np.float32)
+
+
+class RecordingEmbed:
+    """embed_fn stand-in that records every call it gets."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_on and self.fail_on in texts:
+            raise ValueError(f"cannot embed {self.fail_on}")
+        return fake_vectors(texts)
+
+
+def use_fake_encoder(cache_dir: Path) -> RecordingEmbed:
+    """Swap the model for a recording stub and point the cache at cache_dir."""
+    encode = RecordingEmbed()
+    embeddings._encode = lambda texts, batch_size: encode(texts)
+    embeddings.EMBEDDING_CACHE_DIR = cache_dir
+    embeddings._memory_cache.clear()
+    return encode
+
+
+def test_embed_texts_dedupes_without_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        encode = use_fake_encoder(Path(tmp))
+        rows = embeddings.embed_texts(["a-1", "b-2", "a-1"], use_cache=False)
+        assert encode.calls == [["a-1", "b-2"]], encode.calls
+        assert rows[:, 0].tolist() == [1.0, 2.0, 1.0]
+        assert not list(Path(tmp).iterdir())
+
+
+def test_embed_texts_cache_replays_in_input_order():
+    with tempfile.TemporaryDirectory() as tmp:
+        encode = use_fake_encoder(Path(tmp))
+
+        # Miss: each distinct text encoded once, then stored
+        rows = embeddings.embed_texts(["a-1", "b-2", "a-1"], use_cache=True)
+        assert encode.calls == [["a-1", "b-2"]], encode.calls
+        assert rows[:, 0].tolist() == [1.0, 2.0, 1.0]
+        assert len(list(Path(tmp).glob("*.npy"))) == 2
+
+        # Disk hit (memory cache cleared) mixed with one new text
+        embeddings._memory_cache.clear()
+        rows = embeddings.embed_texts(["c-3", "a-1", "b-2", "c-3"], use_cache=True)
+        assert encode.calls == [["a-1", "b-2"], ["c-3"]], encode.calls
+        assert rows[:, 0].tolist() == [3.0, 1.0, 2.0, 3.0]
+
+        # A corrupt entry is discarded and re-encoded
+        for path in Path(tmp).glob("*.npy"):
+            path.write_bytes(b"not an array")
+        embeddings._memory_cache.clear()
+        rows = embeddings.embed_texts(["b-2"], use_cache=True)
+        assert encode.calls[-1] == ["b-2"]
+        assert rows[:, 0].tolist() == [2.0]
+
+
+def test_embedding_cache_is_pruned_to_max_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        use_fake_encoder(Path(tmp))
+        embeddings.embed_texts(["a-1", "b-2", "c-3"], use_cache=True)
+
+        # First write of a new process trims the oldest entries
+        embeddings._cache_pruned = False
+        embeddings.EMBEDDING_CACHE_MAX_ENTRIES = 2
+        try:
+            embeddings.embed_texts(["d-4"], use_cache=True)
+        finally:
+            embeddings.EMBEDDING_CACHE_MAX_ENTRIES = 50000
+        assert len(list(Path(tmp).glob("*.npy"))) == 2
+
+
+def test_coalescer_merges_and_splits_rows():
+    embed_fn = RecordingEmbed()
+    coalescer = embeddings.BatchCoalescer(embed_fn, window=0.05, max_batch=64)
+
+    async def main():
+        return await asyncio.gather(
+            coalescer.embed(["a-1", "a-2", "a-3"]),
+            coalescer.embed(["b-10", "b-11"]),
+        )
+
+    rows_a, rows_b = asyncio.run(main())
+    assert embed_fn.calls == [["a-1", "a-2", "a-3", "b-10", "b-11"]], embed_fn.calls
+    assert rows_a[:, 0].tolist() == [1.0, 2.0, 3.0]
+    assert rows_b[:, 0].tolist() == [10.0, 11.0]
+
+
+def test_coalescer_failure_only_fails_its_caller():
+    embed_fn = RecordingEmbed(fail_on="bad-0")
+    coalescer = embeddings.BatchCoalescer(embed_fn, window=0.05, max_batch=64)
+
+    async def main():
+        return await asyncio.gather(
+            coalescer.embed(["ok-1", "ok-2"]),
+            coalescer.embed(["bad-0"]),
+            return_exceptions=True,
+        )
+
+    good, bad = asyncio.run(main())
+    assert isinstance(bad, ValueError), bad
+    assert good[:, 0].tolist() == [1.0, 2.0]
+    # Merged call, then one retry per job
+    assert embed_fn.calls == [["ok-1", "ok-2", "bad-0"], ["ok-1", "ok-2"], ["bad-0"]]
+
+
+def test_coalescer_max_batch_starts_a_new_call():
+    embed_fn = RecordingEmbed()
+    coalescer = embeddings.BatchCoalescer(embed_fn, window=0.05, max_batch=2)
+
+    async def main():
+        return await asyncio.gather(*(coalescer.embed([f"t-{i}"]) for i in range(5)))
+
+    results = asyncio.run(main())
+    assert [r[0, 0] for r in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert all(len(call) <= 2 for call in embed_fn.calls), embed_fn.calls
+
+
+def test_coalescer_survives_successive_event_loops():
+    # validate_frames_sync runs asyncio.run once per call
+    embed_fn = RecordingEmbed()
+    coalescer = embeddings.BatchCoalescer(embed_fn, window=0.01)
+    first = asyncio.run(coalescer.embed(["x-1"]))
+    second = asyncio.run(coalescer.embed(["x-2", "x-3"]))
+    assert first[:, 0].tolist() == [1.0]
+    assert second[:, 0].tolist() == [2.0, 3.0]
+    assert len(embed_fn.calls) == 2
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_")]
+    for name, fn in tests:
+        fn()
+        print(f"PASS: {name}")
+    print(f"\n{len(tests)} checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Check extractor behaviour that doesn't need a live Mistral key.
+
+Stubs the Mistral client and checks document truncation, the on-disk
+response cache, extract_frames_many ordering/concurrency, and the
+model_construct fast path.
+
+Usage:
+    cd python && source .venv/bin/activate
+    python tests/test_extractor.py
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents import extractor
+
+
+GOOD_FRAME = {
+    "id": "reparations-as-debt",
+    "labels": {"en": "debt", "de": "Schuld"},
+    "definitions": {"en": "A financial obligation", "de": "Eine finanzielle Verpflichtung"},
+    "cluster": "justice",
+    "source_quote": "all the loss and damage",
+    "confidence": 0.9,
+}
+
+
+class FakeChat:
+    """Stand-in for client.chat; returns canned content and tracks concurrency."""
+
+    def __init__(self, contents, delay=0.0):
+        self.contents = contents
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete_async(self, model, messages, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        prompt = messages[-1]["content"]
+        try:
+            # Finish later documents first so ordering is actually exercised
+            if callable(self.delay):
+                await asyncio.sleep(self.delay(prompt))
+            content = self.contents(prompt) if callable(self.contents) else self.contents
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def use_fake_client(chat: FakeChat, cache_dir: Path):
+    """Point the extractor at a fake client and a scratch cache dir."""
+    extractor.get_client = lambda: SimpleNamespace(chat=chat)
+    extractor.EXTRACTOR_CACHE_DIR = cache_dir
+
+
+def test_truncate_document_char_fallback():
+    extractor._tokenizer = False  # as if mistral-common were missing
+    assert extractor.truncate_document("short text") == "short text"
+
+    document = "word " * 5000  # 25000 chars
+    truncated = extractor.truncate_document(document)
+    assert len(truncated) <= extractor.MAX_DOCUMENT_CHARS
+    assert truncated.endswith("word")  # cut at whitespace, not mid-word
+
+
+def test_truncate_document_token_budget():
+    class WordTokenizer:
+        def encode(self, text, bos, eos):
+            return text.split()
+
+        def decode(self, tokens):
+            return " ".join(tokens)
+
+    extractor._tokenizer = WordTokenizer()
+    try:
+        assert extractor.truncate_document("a b c", max_tokens=5) == "a b c"
+        assert extractor.truncate_document("a b c d e f", max_tokens=3) == "a b c"
+    finally:
+        extractor._tokenizer = None
+
+
+def test_cache_hit_miss_and_corrupt_entry():
+    extractor._tokenizer = False
+    with tempfile.TemporaryDirectory() as tmp:
+        chat = FakeChat(json.dumps([GOOD_FRAME]))
+        use_fake_client(chat, Path(tmp))
+
+        # Miss: calls the API and stores the response
+        frames = asyncio.run(extractor.extract_frames("doc", use_cache=True))
+        assert [f.id for f in frames] == ["reparations-as-debt"]
+        assert chat.calls == 1
+        entries = list(Path(tmp).glob("*.json"))
+        assert len(entries) == 1
+        assert not list(Path(tmp).glob("*.tmp"))
+
+        # Hit: same request, no API call
+        frames = asyncio.run(extractor.extract_frames("doc", use_cache=True))
+        assert [f.id for f in frames] == ["reparations-as-debt"]
+        assert chat.calls == 1
+
+        # Corrupt entry: discarded and fetched again
+        entries[0].write_text("{not json", encoding="utf-8")
+        frames = asyncio.run(extractor.extract_frames("doc", use_cache=True))
+        assert [f.id for f in frames] == ["reparations-as-debt"]
+        assert chat.calls == 2
+        assert json.loads(entries[0].read_text(encoding="utf-8"))[0]["id"] == "reparations-as-debt"
+
+        # Bypass: always calls the API
+        asyncio.run(extractor.extract_frames("doc", use_cache=False))
+        assert chat.calls == 3
+
+
+def test_unparseable_response_is_not_cached():
+    extractor._tokenizer = False
+    with tempfile.TemporaryDirectory() as tmp:
+        chat = FakeChat("not json at all")
+        use_fake_client(chat, Path(tmp))
+
+        assert asyncio.run(extractor.extract_frames("doc", use_cache=True)) == []
+        assert not list(Path(tmp).iterdir())
+
+
+def test_extract_frames_many_order_and_concurrency():
+    extractor._tokenizer = False
+    documents = [f"document-{i}" for i in range(6)]
+
+    def index_of(prompt):
+        return next(i for i, d in enumerate(documents) if d in prompt)
+
+    def content(prompt):
+        return json.dumps([dict(GOOD_FRAME, id=f"frame-{index_of(prompt)}")])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chat = FakeChat(content, delay=lambda p: 0.01 * (len(documents) - index_of(p)))
+        use_fake_client(chat, Path(tmp))
+
+        results = asyncio.run(extractor.extract_frames_many(
+            documents, concurrency=2, use_cache=False
+        ))
+
+    assert [[f.id for f in r] for r in results] == [[f"frame-{i}"] for i in range(6)]
+    assert chat.calls == 6
+    assert chat.max_in_flight == 2
+
+
+def test_model_construct_fast_path_and_fallback():
+    extractor._tokenizer = False
+    frames_json = json.dumps([
+        GOOD_FRAME,
+        dict(GOOD_FRAME, id="string-confidence", confidence="0.7"),
+        dict(GOOD_FRAME, id="null-definition", definitions={"en": "x", "de": None}),
+        dict(GOOD_FRAME, id="numeric-label", labels={"en": 3}),
+        dict(GOOD_FRAME, id="numeric-quote", source_quote=12),
+        "not a frame",
+    ])
+    with tempfile.TemporaryDirectory() as tmp:
+        use_fake_client(FakeChat(frames_json), Path(tmp))
+        frames = asyncio.run(extractor.extract_frames("doc", use_cache=False))
+
+    by_id = {f.id: f for f in frames}
+    assert set(by_id) == {"reparations-as-debt", "string-confidence"}
+    assert by_id["string-confidence"].confidence == 0.7
+    for frame in frames:
+        assert all(isinstance(v, str) for v in frame.labels.values())
+        assert all(isinstance(v, str) for v in frame.definitions.values())
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_")]
+    for name, fn in tests:
+        fn()
+        print(f"PASS: {name}")
+    print(f"\n{len(tests)} checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Check interpreter streaming helpers that don't need a live Mistral key.
+
+Feeds a JSON response in fragments to check that fields are emitted only
+once complete, and streams a stubbed client whose deltas mix plain
+strings and content-chunk lists.
+
+Usage:
+    cd python && source .venv/bin/activate
+    python tests/test_interpreter.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents import interpreter
+
+
+RESPONSE = json.dumps({
+    "cultural": "Debt and guilt share one word, Schuld.",
+    "historical": "Article 231 assigned responsibility.",
+    "structural": "Sits between justice and finance.",
+    "citations": ["Keynes 1919", "Versailles Art. 231"],
+}, indent=2)
+
+CARD = dict(
+    concept_id="reparations-as-debt",
+    concept_label="debt",
+    definitions={"en": "A financial obligation", "de": "Eine Schuld"},
+    neighbors={"en": [], "de": []},
+    position={"en": [0.0, 0.0], "de": [1.0, 1.0]},
+    is_ghost={"en": False, "de": False},
+    cluster="justice",
+)
+
+
+def fragments(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_completed_fields_only_returns_finished_values():
+    expected = json.loads(RESPONSE)
+    keys = list(expected)
+    seen = {}
+    content = ""
+    for fragment in fragments(RESPONSE, 7):
+        content += fragment
+        fields = interpreter._completed_fields(content)
+        # Always a prefix of the keys, with final values
+        assert list(fields) == keys[:len(fields)], fields
+        for key, value in fields.items():
+            assert value == expected[key], (key, value)
+        # A field never disappears once emitted
+        assert set(seen) <= set(fields)
+        seen = fields
+    assert seen == expected
+
+    # Cut inside a string value, and right after a number with no ',' yet
+    assert interpreter._completed_fields('{"cultural": "Debt and gu') == {}
+    assert interpreter._completed_fields('{"a": "x", "b": 12') == {"a": "x"}
+    assert interpreter._completed_fields('{"a": "x", "b": 12}') == {"a": "x", "b": 12}
+    assert interpreter._completed_fields("no json yet") == {}
+
+
+def stream_events(pieces):
+    for piece in pieces:
+        delta = SimpleNamespace(content=piece)
+        yield SimpleNamespace(data=SimpleNamespace(choices=[SimpleNamespace(delta=delta)]))
+
+
+def test_stream_accepts_chunk_list_deltas():
+    pieces = []
+    for i, fragment in enumerate(fragments(RESPONSE, 11)):
+        if i % 2:
+            # Content-chunk list, as DeltaMessage.content may be
+            half = len(fragment) // 2
+            pieces.append([SimpleNamespace(type="text", text=fragment[:half]),
+                           SimpleNamespace(type="text", text=fragment[half:])])
+        else:
+            pieces.append(fragment)
+    pieces.insert(1, None)
+
+    chat = SimpleNamespace(stream=lambda **kwargs: stream_events(pieces))
+    interpreter.get_client = lambda: SimpleNamespace(chat=chat)
+    with tempfile.TemporaryDirectory() as tmp:
+        interpreter.INTERPRETER_CACHE_DIR = Path(tmp)
+        updates = list(interpreter.interpret_lacuna_stream(**CARD))
+
+    sizes = [len(u) for u in updates[:-1]]
+    assert sizes == sorted(set(sizes)), sizes
+    final = updates[-1]
+    assert final["cultural"] == json.loads(RESPONSE)["cultural"]
+    assert final["citations"] == ["Keynes 1919", "Versailles Art. 231"]
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_")]
+    for name, fn in tests:
+        fn()
+        print(f"PASS: {name}")
+    print(f"\n{len(tests)} checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Check the vectorized benchmark metrics against straightforward
+reference implementations.
+
+Each metric in benchmark/metrics.py replaced a scipy/sklearn call or a
+per-row loop with a batched equivalent; these checks run the original
+formulations on seeded data and require the same numbers.
+
+Usage:
+    cd python && source .venv/bin/activate
+    python tests/test_metrics.py
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+from scipy.spatial.distance import pdist, squareform
+from sklearn.metrics import silhouette_samples, silhouette_score
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark import metrics
+from lib.embeddings import compute_embedding_weight
+
+
+def make_embeddings(seed, n=40, dim=32, noise=1.0):
+    rng = np.random.default_rng(seed)
+    en = rng.normal(size=(n, dim))
+    de = en + rng.normal(size=(n, dim)) * noise
+    return en.astype(np.float32), de.astype(np.float32)
+
+
+def reference_mantel(en, de, n_permutations):
+    """Mantel test as a spearmanr loop over permuted distance matrices."""
+    dist_en = squareform(pdist(en, metric="cosine"))
+    dist_de = squareform(pdist(de, metric="cosine"))
+    triu = np.triu_indices(len(en), k=1)
+    correlation, _ = stats.spearmanr(dist_en[triu], dist_de[triu])
+    perm_correlations = []
+    for _ in range(n_permutations):
+        perm = np.random.permutation(len(en))
+        perm_corr, _ = stats.spearmanr(dist_en[triu], dist_de[perm][:, perm][triu])
+        perm_correlations.append(perm_corr)
+    p_value = (np.sum(np.abs(perm_correlations) >= np.abs(correlation)) + 1) / (n_permutations + 1)
+    return correlation, p_value
+
+
+def test_topology_matches_spearmanr_permutation_loop():
+    # Strong, weak and no structure (p from 0.005 up to ~0.6)
+    for seed, noise in [(0, 0.5), (2, 4.0), (4, 50.0), (7, 50.0)]:
+        en, de = make_embeddings(seed, noise=noise)
+
+        np.random.seed(seed)
+        expected_r, expected_p = reference_mantel(en, de, 199)
+        np.random.seed(seed)
+        r, p = metrics.compute_topology_preservation(en, de, n_permutations=199)
+
+        assert abs(r - expected_r) < 1e-6, (seed, r, expected_r)
+        assert p == expected_p, (seed, p, expected_p)
+
+
+def test_clas_matches_per_concept_cosine():
+    en, de = make_embeddings(3)
+    ids = [f"c{i}" for i in range(len(en))]
+    avg, per_concept = metrics.compute_clas(en, de, ids)
+
+    for i, cid in enumerate(ids):
+        cos = float(en[i] @ de[i] / (np.linalg.norm(en[i]) * np.linalg.norm(de[i])))
+        assert abs(per_concept[cid] - cos) < 1e-5, (cid, per_concept[cid], cos)
+    assert abs(avg - np.mean(list(per_concept.values()))) < 1e-6
+
+
+def test_cluster_coherence_matches_sklearn_cosine():
+    en, _ = make_embeddings(4, n=60)
+    labels = [f"k{i % 4}" for i in range(len(en))]
+    per_cluster, avg = metrics.compute_cluster_coherence(en, labels)
+
+    expected_avg = silhouette_score(en, labels, metric="cosine")
+    samples = silhouette_samples(en, labels, metric="cosine")
+    assert abs(avg - expected_avg) < 1e-5, (avg, expected_avg)
+    for cluster, score in per_cluster.items():
+        mask = np.array(labels) == cluster
+        assert abs(score - samples[mask].mean()) < 1e-5, cluster
+
+    # Too few clusters
+    assert metrics.compute_cluster_coherence(en, ["k"] * len(en)) == ({}, 0.0)
+
+
+def test_ghost_detection_matches_per_concept_weights():
+    en, _ = make_embeddings(5)
+    en /= np.linalg.norm(en, axis=1, keepdims=True)
+    ids = [f"c{i}" for i in range(len(en))]
+    ghost_flags = {cid: i % 3 == 0 for i, cid in enumerate(ids)}
+    rate, scores = metrics.compute_ghost_detection_rate(en, ids, ghost_flags)
+
+    expected = {
+        cid: compute_embedding_weight(en[i], en)
+        for i, cid in enumerate(ids) if ghost_flags[cid]
+    }
+    assert scores.keys() == expected.keys()
+    for cid, weight in expected.items():
+        assert abs(scores[cid] - weight) < 1e-5, (cid, scores[cid], weight)
+    assert rate == sum(w < 0.3 for w in expected.values()) / len(expected)
+
+
+def test_run_all_metrics_matches_standalone_metrics():
+    en, de = make_embeddings(6)
+    en /= np.linalg.norm(en, axis=1, keepdims=True)
+    de /= np.linalg.norm(de, axis=1, keepdims=True)
+    ids = [f"c{i}" for i in range(len(en))]
+    labels = [f"k{i % 3}" for i in range(len(en))]
+    flags_en = {cid: i % 4 == 0 for i, cid in enumerate(ids)}
+    flags_de = {cid: i % 5 == 0 for i, cid in enumerate(ids)}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        np.random.seed(0)
+        results = metrics.run_all_metrics(en, de, ids, labels, flags_en, flags_de, "test")
+
+    np.random.seed(0)
+    r, p = metrics.compute_topology_preservation(en, de)
+    assert abs(results.topology_preservation - r) < 1e-6 and results.topology_p_value == p
+    assert abs(results.clas_score - metrics.compute_clas(en, de, ids)[0]) < 1e-6
+    coherence_en = metrics.compute_cluster_coherence(en, labels)
+    coherence_de = metrics.compute_cluster_coherence(de, labels)
+    assert abs(results.cluster_coherence_avg - (coherence_en[1] + coherence_de[1]) / 2) < 1e-6
+    rate_en, _ = metrics.compute_ghost_detection_rate(en, ids, flags_en)
+    rate_de, _ = metrics.compute_ghost_detection_rate(de, ids, flags_de)
+    assert results.ghost_detection_rate == (rate_en + rate_de) / 2
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_")]
+    for name, fn in tests:
+        fn()
+        print(f"PASS: {name}")
+    print(f"\n{len(tests)} checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Check NeighborSearch.find_neighbors on a small synthetic corpus.
+
+Writes a scratch data dir (embeddings, concept ids, labels) and checks
+the top-N search: near-duplicates of the query are skipped, exactly N
+neighbors come back in descending order, and N larger than the corpus
+returns every eligible row.
+
+Usage:
+    cd python && source .venv/bin/activate
+    python tests/test_neighbors.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.neighbors import NeighborSearch
+
+
+def make_search(tmp: Path, embeddings: np.ndarray) -> NeighborSearch:
+    ids = [f"c{i}" for i in range(len(embeddings))]
+    np.save(tmp / "embeddings_en.npy", embeddings.astype(np.float32))
+    (tmp / "concept_ids_en.json").write_text(json.dumps(ids))
+    # Labels for all but the last concept (falls back to its id)
+    concepts = [{"id": cid, "labels": {"en": f"label {cid}"}} for cid in ids[:-1]]
+    (tmp / "versailles.json").write_text(json.dumps(concepts))
+    settings.data_dir = str(tmp)
+    return NeighborSearch()
+
+
+def corpus(n=12, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n, dim))
+
+
+def test_skips_near_duplicate_and_fills_top_n():
+    embeddings = corpus()
+    query = embeddings[3] * 2.5  # same direction: cos = 1 with row 3
+    embeddings[5] = embeddings[3] + 1e-4  # near-duplicate, cos > 0.999
+
+    with tempfile.TemporaryDirectory() as tmp:
+        search = make_search(Path(tmp), embeddings)
+        neighbors = search.find_neighbors(query, "en", n=4)
+
+    ids = [nb.id for nb in neighbors]
+    sims = [nb.similarity for nb in neighbors]
+    assert len(neighbors) == 4, ids
+    assert "c3" not in ids and "c5" not in ids, ids
+    assert sims == sorted(sims, reverse=True), sims
+    assert all(s <= 0.999 for s in sims)
+
+    # Same answer as scoring every row by hand
+    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    expected = unit @ (query / np.linalg.norm(query))
+    order = [i for i in np.argsort(-expected) if expected[i] <= 0.999][:4]
+    assert ids == [f"c{i}" for i in order], (ids, order)
+    assert np.allclose(sims, expected[order], atol=1e-5)
+
+
+def test_n_larger_than_eligible_returns_all_eligible():
+    embeddings = corpus(n=5)
+    query = embeddings[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        search = make_search(Path(tmp), embeddings)
+        neighbors = search.find_neighbors(query, "en", n=50)
+
+    ids = [nb.id for nb in neighbors]
+    sims = [nb.similarity for nb in neighbors]
+    assert sorted(ids) == ["c1", "c2", "c3", "c4"], ids
+    assert sims == sorted(sims, reverse=True), sims
+    # Labels from versailles.json, falling back to the id
+    labels = {nb.id: nb.label for nb in neighbors}
+    assert labels["c1"] == "label c1" and labels["c4"] == "c4"
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_")]
+    for name, fn in tests:
+        fn()
+        print(f"PASS: {name}")
+    print(f"\n{len(tests)} checks passed")
+
+
+if __name__ == "__main__":
+    main()